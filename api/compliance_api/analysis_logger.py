@@ -8,13 +8,14 @@ allowing the frontend to display real-time processing information.
 import json
 import time
 import threading
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 # Thread-safe log storage
 _log_lock = threading.Lock()
-_logs = []
 _max_logs = 100  # Maximum number of logs to keep in memory
+_logs = deque(maxlen=_max_logs)  # Oldest entries are discarded automatically in O(1)
 
 class AnalysisLogger:
     """
@@ -55,9 +56,6 @@ class AnalysisLogger:
         
         with _log_lock:
             _logs.append(log_entry)
-            # Trim logs if they exceed the maximum
-            if len(_logs) > _max_logs:
-                _logs.pop(0)
         
         return log_entry
     
@@ -73,7 +71,7 @@ class AnalysisLogger:
             List of log entries matching the filters
         """
         with _log_lock:
-            filtered_logs = _logs.copy()
+            filtered_logs = list(_logs)
         
         # Apply filters
         if log_type:
@@ -252,9 +250,6 @@ def _add_log(step_type: str, application_id: str, framework: str, details: Dict[
     
     with _log_lock:
         _logs.append(log_entry)
-        # Trim logs if they exceed the maximum
-        if len(_logs) > _max_logs:
-            _logs.pop(0)
     
     return log_entry
 
@@ -271,7 +266,7 @@ def get_logs(limit: int = 50, application_id: Optional[str] = None, step_type: O
         List of log entries matching the filters
     """
     with _log_lock:
-        filtered_logs = _logs.copy()
+        filtered_logs = list(_logs)
     
     # Apply filters
     if application_id:
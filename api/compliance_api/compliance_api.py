@@ -1,10 +1,14 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from compliance_wrapper import ComplianceWrapper
+from cors_middleware import FastWildcardCORS
 from data_loader import LoanDataLoader
 import os
 import json
+import orjson
+from functools import lru_cache
+from cachetools import FIFOCache
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -14,38 +18,67 @@ load_dotenv()
 app = FastAPI(
     title="Promethios Compliance API",
     description="API for the Promethios Compliance Demo",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # For demo purposes, allow all origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Add CORS middleware (for demo purposes, allow all origins, methods and headers)
+app.add_middleware(FastWildcardCORS)
+
+# Compress larger responses (application and decision lists repeat the same keys heavily)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Initialize components
 compliance_wrapper = ComplianceWrapper()
 data_loader = LoanDataLoader()
 
-# Store processed decisions in memory for demo
-decisions_store = {}
+# Store processed decisions in memory for demo, bounded so a long-running demo does not grow without limit.
+# Decisions are immutable once stored, so each is kept as (decision, encoded JSON) and encoded only once.
+MAX_STORED_DECISIONS = 10000
+decisions_store = FIFOCache(maxsize=MAX_STORED_DECISIONS)
+
+# Fixed timestamps for demo
+DECISION_TIMESTAMP = "2023-04-15T10:30:00Z"
+VERIFICATION_TIMESTAMP = "2023-04-15T10:35:00Z"
+
+@lru_cache(maxsize=256)
+def _evaluate_application(application_id, framework):
+    """
+    Load and evaluate an application, memoised on (application_id, framework).
+
+    Evaluation is deterministic for the static demo dataset; call
+    _evaluate_application.cache_clear() if the underlying loan data changes.
+    Returns (None, None) when the application does not exist.
+    """
+    application = data_loader.get_application_by_id(application_id)
+    if not application:
+        return None, None
+    return application, compliance_wrapper.evaluate_compliance(application, framework)
+
+def _encode_json(content):
+    # Data loaded via pandas may carry numpy scalars
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _json_response(content_bytes):
+    # Pre-serialized payloads skip jsonable_encoder and response re-serialization
+    return Response(content=content_bytes, media_type="application/json")
 
-@app.get("/", summary="API Health Check", tags=["System"])
+ROOT_RESPONSE_JSON = _encode_json({"message": "Promethios Compliance API is active."})
+
+@app.get("/", summary="API Health Check", tags=["System"], response_class=Response)
 async def root():
-    return {"message": "Promethios Compliance API is active."}
+    return _json_response(ROOT_RESPONSE_JSON)
 
-@app.get("/api/applications", summary="Get Loan Applications", tags=["Compliance"])
+@app.get("/api/applications", summary="Get Loan Applications", tags=["Compliance"], response_class=Response)
 async def get_applications(count: int = 5):
     applications = data_loader.load_loan_applications(count)
-    return applications
+    return _json_response(_encode_json(applications))
 
-@app.post("/api/process", summary="Process Loan Application", tags=["Compliance"])
+@app.post("/api/process", summary="Process Loan Application", tags=["Compliance"], response_class=Response)
 async def process_application(request: Request):
     try:
-        data = await request.json()
+        # Parse raw bytes directly; orjson.JSONDecodeError subclasses json.JSONDecodeError
+        data = orjson.loads(await request.body())
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail="Invalid JSON")
     
@@ -57,14 +90,11 @@ async def process_application(request: Request):
     # Get regulatory framework
     framework = data.get("framework", "GDPR")
     
-    # Get application data
-    application = data_loader.get_application_by_id(application_id)
+    # Get application data and evaluate compliance
+    application, compliance_result = _evaluate_application(application_id, framework)
     if not application:
         raise HTTPException(status_code=404, detail=f"Application {application_id} not found")
     
-    # Evaluate compliance
-    compliance_result = compliance_wrapper.evaluate_compliance(application, framework)
-    
     # Generate decision ID
     decision_id = f"decision_{application_id}_{framework}"
     
@@ -73,25 +103,27 @@ async def process_application(request: Request):
         "decision_id": decision_id,
         "application_id": application_id,
         "framework": framework,
-        "timestamp": "2023-04-15T10:30:00Z",  # Fixed for demo
+        "timestamp": DECISION_TIMESTAMP,
         "compliance_result": compliance_result,
         "application_data": application
     }
+    decision_json = _encode_json(decision)
     
-    decisions_store[decision_id] = decision
+    decisions_store[decision_id] = (decision, decision_json)
     
-    return decision
+    return _json_response(decision_json)
 
-@app.get("/api/decisions", summary="Get All Decisions", tags=["Compliance"])
+@app.get("/api/decisions", summary="Get All Decisions", tags=["Compliance"], response_class=Response)
 async def get_decisions():
-    return list(decisions_store.values())
+    # Stitch the already-encoded decisions into a JSON array
+    return _json_response(b"[" + b",".join(decision_json for _, decision_json in decisions_store.values()) + b"]")
 
-@app.get("/api/decision/{decision_id}", summary="Get Decision by ID", tags=["Compliance"])
+@app.get("/api/decision/{decision_id}", summary="Get Decision by ID", tags=["Compliance"], response_class=Response)
 async def get_decision(decision_id: str):
-    decision = decisions_store.get(decision_id)
-    if not decision:
+    stored = decisions_store.get(decision_id)
+    if not stored:
         raise HTTPException(status_code=404, detail=f"Decision {decision_id} not found")
-    return decision
+    return _json_response(stored[1])
 
 @app.get("/api/verify/{decision_id}", summary="Verify Decision Integrity", tags=["Compliance"])
 async def verify_decision(decision_id: str):
@@ -104,5 +136,5 @@ async def verify_decision(decision_id: str):
         "decision_id": decision_id,
         "verified": True,
         "verification_method": "cryptographic_hash",
-        "timestamp": "2023-04-15T10:35:00Z"  # Fixed for demo
+        "timestamp": VERIFICATION_TIMESTAMP
     }
@@ -2,7 +2,7 @@ import requests
 import json
 import os
 from dotenv import load_dotenv
-from .trust_evaluation_framework import TrustEvaluationFramework
+from .trust_evaluation_framework import TrustEvaluationFramework, COMPLIANCE_THRESHOLDS, DEFAULT_COMPLIANCE_THRESHOLD
 
 # Load environment variables
 load_dotenv()
@@ -74,16 +74,7 @@ class ComplianceWrapper:
     def _check_regulatory_compliance(self, trust_score, regulatory_framework):
         """Legacy method to check if trust score meets regulatory framework requirements."""
         # Different frameworks have different thresholds
-        thresholds = {
-            "GDPR": 65,
-            "FCRA": 60,
-            "CCPA": 70,
-            "GLBA": 75,
-            "EU_AI_ACT": 80,
-            "FINRA": 70
-        }
-        
-        threshold = thresholds.get(regulatory_framework, 65)  # Default to GDPR threshold
+        threshold = COMPLIANCE_THRESHOLDS.get(regulatory_framework, DEFAULT_COMPLIANCE_THRESHOLD)  # Default to GDPR threshold
         
         if trust_score >= threshold:
             return {
@@ -0,0 +1,87 @@
+"""
+CORS Middleware Module for Promethios Compliance Demo
+
+This module provides a lightweight pure-ASGI CORS middleware for the demo's
+allow-everything policy, avoiding the per-request policy checks performed by
+Starlette's general-purpose CORSMiddleware.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+# Headers appended to every cross-origin response
+_ALLOW_CREDENTIALS = (b"access-control-allow-credentials", b"true")
+_VARY_ORIGIN = (b"vary", b"Origin")
+
+# Static headers for preflight responses
+_PREFLIGHT_HEADERS = [
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"600"),
+    (b"content-length", b"2"),
+    (b"content-type", b"text/plain; charset=utf-8"),
+]
+
+
+class FastWildcardCORS:
+    """
+    Pure-ASGI CORS middleware allowing all origins, methods and headers with credentials.
+
+    Because credentials are allowed, the request Origin is echoed back rather than
+    "*" (browsers reject a wildcard origin on credentialed requests), matching the
+    behaviour of CORSMiddleware(allow_origins=["*"], allow_credentials=True).
+    """
+
+    def __init__(self, app: Callable) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight_response(origin, request_headers, send)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin), _ALLOW_CREDENTIALS, _VARY_ORIGIN]
+
+        async def send_with_cors(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    @staticmethod
+    async def _preflight_response(origin: bytes, request_headers: bytes, send: Callable) -> None:
+        """Answer a CORS preflight request directly without invoking the application."""
+        headers: List[Tuple[bytes, bytes]] = [
+            (b"access-control-allow-origin", origin),
+            _ALLOW_CREDENTIALS,
+            _VARY_ORIGIN,
+        ]
+        if request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+        headers.extend(_PREFLIGHT_HEADERS)
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
@@ -1,4 +1,3 @@
-import pandas as pd
 import json
 import os
 from dotenv import load_dotenv
@@ -11,6 +10,7 @@ class LoanDataLoader:
         # Use environment variable or default
         data_dir = os.getenv("DATA_DIR", "../data")
         self.data_path = data_path or os.path.join(data_dir, "lending_club_sample.csv")
+        self._applications_by_id = None  # Built lazily on first lookup
         self._ensure_data_exists()
         
     def _ensure_data_exists(self):
@@ -36,17 +36,26 @@ class LoanDataLoader:
         ]
         
         # Save as CSV
+        import pandas as pd  # Deferred: pandas is only needed when the CSV is touched
         pd.DataFrame(sample_data).to_csv(self.data_path, index=False)
     
     def load_loan_applications(self, count=5):
         """Load a specified number of loan applications."""
+        import pandas as pd
         df = pd.read_csv(self.data_path)
         return df.head(count).to_dict(orient="records")
     
     def get_application_by_id(self, application_id):
         """Get a specific application by ID."""
-        df = pd.read_csv(self.data_path)
-        application = df[df["id"] == application_id]
-        if len(application) == 0:
+        if self._applications_by_id is None:
+            # Read the CSV once and index it, instead of re-reading and scanning it per lookup
+            import pandas as pd
+            records = pd.read_csv(self.data_path).to_dict(orient="records")
+            self._applications_by_id = {}
+            for record in records:
+                self._applications_by_id.setdefault(record["id"], record)
+        application = self._applications_by_id.get(application_id)
+        if application is None:
             return None
-        return application.iloc[0].to_dict()
+        # Return a copy since callers annotate the application during evaluation
+        return dict(application)
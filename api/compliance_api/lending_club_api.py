@@ -11,6 +11,63 @@ import requests
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
+# Map Lending Club grade to our grade format
+_GRADE_MAPPING = {
+    "A": "A",
+    "B": "B",
+    "C": "C",
+    "D": "C",
+    "E": "D",
+    "F": "D",
+    "G": "E"
+}
+
+# Map loan purpose to our format
+_PURPOSE_MAPPING = {
+    "debt_consolidation": "debt_consolidation",
+    "credit_card": "credit_card",
+    "home_improvement": "home_improvement",
+    "house": "home_improvement",
+    "major_purchase": "major_purchase",
+    "car": "major_purchase",
+    "medical": "medical",
+    "moving": "other",
+    "vacation": "other",
+    "wedding": "other",
+    "small_business": "business",
+    "other": "other"
+}
+
+# (our field, Lending Club field, default) for fields copied through unchanged
+_LOAN_FIELD_MAP = (
+    ("interest_rate", "intRate", 0),
+    ("term", "term", 36),
+    ("employment_length", "empLength", 0),
+    ("home_ownership", "homeOwnership", "RENT"),
+    ("annual_income", "annualInc", 0),
+    ("verification_status", "isIncV", "Not Verified"),
+    ("dti", "dti", 0),
+    ("delinq_2yrs", "delinq2Yrs", 0),
+    ("earliest_credit_line", "earliestCrLine", ""),
+    ("inq_last_6mths", "inqLast6Mths", 0),
+    ("mths_since_last_delinq", "mthsSinceLastDelinq", None),
+    ("open_acc", "openAcc", 0),
+    ("pub_rec", "pubRec", 0),
+    ("revol_bal", "revolBal", 0),
+    ("revol_util", "revolUtil", 0),
+    ("total_acc", "totalAcc", 0),
+    ("initial_list_status", "initialListStatus", ""),
+    ("application_type", "applicationType", "Individual"),
+    ("addr_state", "addrState", ""),
+    ("loan_status", "loanStatus", "")
+)
+
 class LendingClubAPI:
     """
     A class that provides integration with the Lending Club API for fetching loan data.
@@ -34,6 +91,8 @@ class LendingClubAPI:
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
+        # Reuse one pooled HTTP session so paginated and follow-up calls skip the TCP/TLS handshake
+        self.session = requests.Session()
     
     def get_available_loans(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """
@@ -47,14 +106,15 @@ class LendingClubAPI:
             List of loan dictionaries
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/loans/listing",
                 headers=self.headers,
                 params={"limit": limit, "offset": offset}
             )
             
             response.raise_for_status()
-            result = response.json()
+            # Parse the raw body directly instead of via requests' charset detection and stdlib json
+            result = _json_loads(response.content)
             
             # Extract loans from the response
             loans = result.get("loans", [])
@@ -64,7 +124,7 @@ class LendingClubAPI:
             
             return transformed_loans
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
             print(f"Error fetching loans from Lending Club: {str(e)}")
             # Return empty list on error
             return []
@@ -80,20 +140,20 @@ class LendingClubAPI:
             Loan details dictionary or None if not found
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/loans/{loan_id}",
                 headers=self.headers
             )
             
             response.raise_for_status()
-            loan = response.json()
+            loan = _json_loads(response.content)
             
             # Transform loan to match our application format
             transformed_loan = self._transform_loan(loan)
             
             return transformed_loan
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
             print(f"Error fetching loan details from Lending Club: {str(e)}")
             # Return None on error
             return None
@@ -111,62 +171,19 @@ class LendingClubAPI:
         # Extract loan ID or generate one if not present
         loan_id = loan.get("id", f"LC_{datetime.now().strftime('%Y%m%d%H%M%S')}")
         
-        # Map Lending Club grade to our grade format
-        grade_mapping = {
-            "A": "A",
-            "B": "B",
-            "C": "C",
-            "D": "C",
-            "E": "D",
-            "F": "D",
-            "G": "E"
-        }
-        grade = grade_mapping.get(loan.get("grade", ""), "C")
-        
-        # Map loan purpose to our format
-        purpose_mapping = {
-            "debt_consolidation": "debt_consolidation",
-            "credit_card": "credit_card",
-            "home_improvement": "home_improvement",
-            "house": "home_improvement",
-            "major_purchase": "major_purchase",
-            "car": "major_purchase",
-            "medical": "medical",
-            "moving": "other",
-            "vacation": "other",
-            "wedding": "other",
-            "small_business": "business",
-            "other": "other"
-        }
-        purpose = purpose_mapping.get(loan.get("purpose", "").lower(), "other")
+        grade = _GRADE_MAPPING.get(loan.get("grade", ""), "C")
+        purpose = _PURPOSE_MAPPING.get(loan.get("purpose", "").lower(), "other")
         
         # Transform the loan
+        get = loan.get
         transformed_loan = {
             "application_id": f"LC_{loan_id}",
-            "amount": loan.get("loanAmount", 0),
+            "amount": get("loanAmount", 0),
             "purpose": purpose,
-            "grade": grade,
-            "interest_rate": loan.get("intRate", 0),
-            "term": loan.get("term", 36),
-            "employment_length": loan.get("empLength", 0),
-            "home_ownership": loan.get("homeOwnership", "RENT"),
-            "annual_income": loan.get("annualInc", 0),
-            "verification_status": loan.get("isIncV", "Not Verified"),
-            "dti": loan.get("dti", 0),
-            "delinq_2yrs": loan.get("delinq2Yrs", 0),
-            "earliest_credit_line": loan.get("earliestCrLine", ""),
-            "inq_last_6mths": loan.get("inqLast6Mths", 0),
-            "mths_since_last_delinq": loan.get("mthsSinceLastDelinq", None),
-            "open_acc": loan.get("openAcc", 0),
-            "pub_rec": loan.get("pubRec", 0),
-            "revol_bal": loan.get("revolBal", 0),
-            "revol_util": loan.get("revolUtil", 0),
-            "total_acc": loan.get("totalAcc", 0),
-            "initial_list_status": loan.get("initialListStatus", ""),
-            "application_type": loan.get("applicationType", "Individual"),
-            "addr_state": loan.get("addrState", ""),
-            "loan_status": loan.get("loanStatus", "")
+            "grade": grade
         }
+        for out_key, lc_key, default in _LOAN_FIELD_MAP:
+            transformed_loan[out_key] = get(lc_key, default)
         
         return transformed_loan
     
@@ -10,6 +10,12 @@ import json
 import requests
 from typing import Dict, Any, List, Optional, Tuple
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
 class OpenAIExplainer:
     """
     A class that provides conversational explainability for compliance decisions
@@ -28,6 +34,8 @@ class OpenAIExplainer:
             raise ValueError("OpenAI API key is required. Set it in the environment as OPENAI_API_KEY or pass it to the constructor.")
         
         self.api_url = "https://api.openai.com/v1/chat/completions"
+        # Reuse one pooled HTTP session so repeated calls skip the TCP/TLS handshake
+        self.session = requests.Session()
         self.model = "gpt-4"  # Default to GPT-4 for high-quality explanations
         
         # Store conversation history for each session
@@ -94,7 +102,7 @@ class OpenAIExplainer:
         
         # Make the API call
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers={
                     "Content-Type": "application/json",
@@ -166,7 +174,7 @@ class OpenAIExplainer:
         
         # Make the API call
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers={
                     "Content-Type": "application/json",
@@ -238,7 +246,7 @@ class OpenAIExplainer:
         
         # Make the API call
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 headers={
                     "Content-Type": "application/json",
@@ -259,7 +267,7 @@ class OpenAIExplainer:
             
             # Extract and parse the recommendations
             recommendations_text = result["choices"][0]["message"]["content"].strip()
-            recommendations = json.loads(recommendations_text)
+            recommendations = _json_loads(recommendations_text)
             
             # Ensure we have a list of recommendations
             if isinstance(recommendations, dict) and "recommendations" in recommendations:
@@ -19,6 +19,34 @@ from reportlab.graphics.shapes import Drawing
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics.charts.linecharts import HorizontalLineChart
+# Table styles are fixed, so they are built once and shared by every report
+_HEADER_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+    ('BACKGROUND', (0, 0), (0, -1), colors.lavender)
+])
+
+_TRUST_FACTOR_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lavender),
+    ('TEXTCOLOR', (2, 1), (2, -1), 
+     lambda row, col, text=None: colors.green if text == "Pass" else colors.red)
+])
+
+_REQUIREMENTS_TABLE_STYLE = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lavender),
+    ('TEXTCOLOR', (1, 1), (1, -1), 
+     lambda row, col, text=None: colors.green if text == "Compliant" else colors.red)
+])
 
 class ComplianceReportGenerator:
     """
@@ -78,6 +106,16 @@ class ComplianceReportGenerator:
             parent=self.styles['Normal'],
             textColor=colors.red
         ))
+        
+        # Recommendation titles share one style; only the inline priority colour varies
+        self._recommendation_title_style = ParagraphStyle(
+            name='RecommendationTitle',
+            parent=self.styles['Heading3'],
+            textColor=colors.black
+        )
+        
+        # (path, bytes) of the last logo read, so the file is not re-read for every report
+        self._logo_cache = None
     
     def generate_report(self, decision_data: Dict[str, Any], trust_factors: Dict[str, Any], 
                         recommendations: List[Dict[str, str]]) -> bytes:
@@ -127,11 +165,23 @@ class ComplianceReportGenerator:
         
         return pdf_data
     
+    def _get_logo_data(self) -> Optional[bytes]:
+        """Return the logo file's bytes, reading the file only when the logo path changes."""
+        if not self.logo_path:
+            return None
+        if self._logo_cache is None or self._logo_cache[0] != self.logo_path:
+            if not os.path.exists(self.logo_path):
+                return None
+            with open(self.logo_path, 'rb') as f:
+                self._logo_cache = (self.logo_path, f.read())
+        return self._logo_cache[1]
+    
     def _add_header(self, story: List, decision_data: Dict[str, Any]) -> None:
         """Add the report header section."""
         # Add logo if available
-        if self.logo_path and os.path.exists(self.logo_path):
-            img = Image(self.logo_path, width=100, height=30)
+        logo_data = self._get_logo_data()
+        if logo_data is not None:
+            img = Image(io.BytesIO(logo_data), width=100, height=30)
             story.append(img)
             story.append(Spacer(1, 12))
         
@@ -152,13 +202,7 @@ class ComplianceReportGenerator:
         ]
         
         table = Table(details, colWidths=[150, 300])
-        table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-            ('BACKGROUND', (0, 0), (0, -1), colors.lavender)
-        ]))
+        table.setStyle(_HEADER_TABLE_STYLE)
         
         story.append(table)
         story.append(Spacer(1, 20))
@@ -216,15 +260,7 @@ class ComplianceReportGenerator:
         
         if len(factor_data) > 1:
             table = Table(factor_data, colWidths=[200, 100, 100])
-            table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lavender),
-                ('TEXTCOLOR', (2, 1), (2, -1), 
-                 lambda row, col, text=None: colors.green if text == "Pass" else colors.red)
-            ]))
+            table.setStyle(_TRUST_FACTOR_TABLE_STYLE)
             
             story.append(table)
         else:
@@ -278,15 +314,7 @@ class ComplianceReportGenerator:
                 req_data.append([req_name, req_status, req_details])
             
             table = Table(req_data, colWidths=[150, 80, 250])
-            table.setStyle(TableStyle([
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.lightgrey),
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lavender),
-                ('TEXTCOLOR', (1, 1), (1, -1), 
-                 lambda row, col, text=None: colors.green if text == "Compliant" else colors.red)
-            ]))
+            table.setStyle(_REQUIREMENTS_TABLE_STYLE)
             
             story.append(table)
         else:
@@ -313,12 +341,7 @@ class ComplianceReportGenerator:
                     priority_color = colors.green
                 
                 # Add recommendation title with priority
-                title_style = ParagraphStyle(
-                    name=f'RecTitle{i}',
-                    parent=self.styles['Heading3'],
-                    textColor=colors.black
-                )
-                story.append(Paragraph(f"{title} <font color='{priority_color}'>[{priority.upper()}]</font>", title_style))
+                story.append(Paragraph(f"{title} <font color='{priority_color}'>[{priority.upper()}]</font>", self._recommendation_title_style))
                 
                 # Add recommendation description
                 story.append(Paragraph(description, self.styles['Normal']))
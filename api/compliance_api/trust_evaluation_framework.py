@@ -12,6 +12,17 @@ from .trust_factors import (
     EthicalConsiderationsFactor
 )
 
+# Compliance thresholds for each regulatory framework
+COMPLIANCE_THRESHOLDS = {
+    "GDPR": 65,
+    "FCRA": 60,
+    "CCPA": 70,
+    "GLBA": 75,
+    "EU_AI_ACT": 80,
+    "FINRA": 70
+}
+DEFAULT_COMPLIANCE_THRESHOLD = COMPLIANCE_THRESHOLDS["GDPR"]
+
 class TrustEvaluationFramework:
     """Framework for evaluating trust using multiple factors."""
     
@@ -69,12 +80,4 @@ class TrustEvaluationFramework:
     
     def _get_threshold(self, regulatory_framework):
         """Get compliance threshold for the given regulatory framework."""
-        thresholds = {
-            "GDPR": 65,
-            "FCRA": 60,
-            "CCPA": 70,
-            "GLBA": 75,
-            "EU_AI_ACT": 80,
-            "FINRA": 70
-        }
-        return thresholds.get(regulatory_framework, 65)
+        return COMPLIANCE_THRESHOLDS.get(regulatory_framework, DEFAULT_COMPLIANCE_THRESHOLD)
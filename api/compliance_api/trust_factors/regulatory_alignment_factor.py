@@ -10,6 +10,18 @@ from .base_factor import BaseTrustFactor
 class FrameworkComplianceEvaluator:
     """Evaluates compliance with specific regulatory frameworks."""
     
+    TRANSPARENT_GRADES = frozenset({"A", "B"})
+    HIGH_RISK_GRADES = frozenset({"D", "E"})
+    
+    def __init__(self):
+        """Initialize the evaluator with its per-framework adjustment rules."""
+        # Dispatch table of framework-specific adjustments; unknown frameworks get no adjustment
+        self._framework_adjustments = {
+            "EU_AI_ACT": self._eu_ai_act_adjustment,
+            "FINRA": self._finra_adjustment,
+            "GDPR": self._gdpr_adjustment
+        }
+    
     def evaluate(self, data):
         """
         Evaluate framework compliance.
@@ -27,47 +39,55 @@ class FrameworkComplianceEvaluator:
         compliance_score = 70
         
         # Adjust based on framework-specific requirements
-        if framework == "EU_AI_ACT":
-            # EU AI Act emphasizes transparency and fairness
-            grade = data.get("grade", "")
-            dti = data.get("dti", 0)
-            
-            # Grade A and B loans are generally more transparent in their risk assessment
-            if grade in ["A", "B"]:
-                compliance_score += 15
-            elif grade in ["D", "E"]:
-                compliance_score -= 10
-            
-            # Lower DTI ratios are more likely to be fair assessments
-            if dti < 20:
-                compliance_score += 10
-            elif dti > 35:
-                compliance_score -= 15
-                
-        elif framework == "FINRA":
-            # FINRA emphasizes proper risk assessment and disclosure
-            delinq_2yrs = data.get("delinq_2yrs", 0)
-            dti = data.get("dti", 0)
-            
-            # Fewer delinquencies indicate better risk assessment
-            if delinq_2yrs == 0:
-                compliance_score += 15
-            elif delinq_2yrs > 2:
-                compliance_score -= 20
-            
-            # Lower DTI ratios are less risky
-            if dti < 25:
-                compliance_score += 10
-            elif dti > 40:
-                compliance_score -= 15
-                
-        elif framework == "GDPR":
-            # GDPR emphasizes data protection and consent
-            # For demo purposes, we'll assume all applications have proper consent
-            compliance_score += 10
+        adjustment = self._framework_adjustments.get(framework)
+        if adjustment is not None:
+            compliance_score += adjustment(data)
             
         # Ensure score is between 0 and 100
         return max(0, min(100, compliance_score))
+    
+    def _eu_ai_act_adjustment(self, data):
+        """EU AI Act emphasizes transparency and fairness."""
+        adjustment = 0
+        grade = data.get("grade", "")
+        dti = data.get("dti", 0)
+        
+        # Grade A and B loans are generally more transparent in their risk assessment
+        if grade in self.TRANSPARENT_GRADES:
+            adjustment += 15
+        elif grade in self.HIGH_RISK_GRADES:
+            adjustment -= 10
+        
+        # Lower DTI ratios are more likely to be fair assessments
+        if dti < 20:
+            adjustment += 10
+        elif dti > 35:
+            adjustment -= 15
+        return adjustment
+    
+    def _finra_adjustment(self, data):
+        """FINRA emphasizes proper risk assessment and disclosure."""
+        adjustment = 0
+        delinq_2yrs = data.get("delinq_2yrs", 0)
+        dti = data.get("dti", 0)
+        
+        # Fewer delinquencies indicate better risk assessment
+        if delinq_2yrs == 0:
+            adjustment += 15
+        elif delinq_2yrs > 2:
+            adjustment -= 20
+        
+        # Lower DTI ratios are less risky
+        if dti < 25:
+            adjustment += 10
+        elif dti > 40:
+            adjustment -= 15
+        return adjustment
+    
+    def _gdpr_adjustment(self, data):
+        """GDPR emphasizes data protection and consent."""
+        # For demo purposes, we'll assume all applications have proper consent
+        return 10
 
 class DocumentationEvaluator:
     """Evaluates the quality and completeness of documentation."""
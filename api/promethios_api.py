@@ -3,7 +3,13 @@ import sys
 import json
 import time
 import uuid
-from flask import Flask, request, jsonify, send_file
+import threading
+from dataclasses import asdict, dataclass
+import orjson
+from asgiref.wsgi import WsgiToAsgi
+from cachetools import FIFOCache, LRUCache
+from flask import Flask, request, send_file
+from flask_compress import Compress
 from flask_cors import CORS
 from compliance_api.compliance_wrapper import ComplianceWrapper
 from compliance_api.analysis_logger import AnalysisLogger
@@ -13,73 +19,88 @@ from compliance_api.pdf_report_generator import PDFReportGenerator
 app = Flask(__name__)
 CORS(app)
 
+# Compress larger JSON responses such as /api/logs; PDFs are already compressed and excluded by mimetype
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_LEVEL"] = 5
+Compress(app)
+
+# ASGI entry point so the app can be served by uvicorn (uvloop + httptools) instead of the werkzeug dev server
+asgi_app = WsgiToAsgi(app)
+
 # Initialize components
 compliance_wrapper = ComplianceWrapper()
 analysis_logger = AnalysisLogger()
 openai_explainer = OpenAIExplainer()
 pdf_generator = PDFReportGenerator()
 
-# In-memory storage for demo purposes
-applications = []
-decisions = {}
-session_contexts = {}
+# In-memory storage for demo purposes, bounded so a long-running demo does not grow without limit
+MAX_STORED_DECISIONS = 10000
+MAX_SESSION_CONTEXTS = 1000
+# Decisions evict oldest-first; sessions evict least recently updated
+decisions = FIFOCache(maxsize=MAX_STORED_DECISIONS)
+session_contexts = LRUCache(maxsize=MAX_SESSION_CONTEXTS)
+# Generated report paths by decision ID; a stored decision does not change until it is re-evaluated
+report_paths = FIFOCache(maxsize=MAX_STORED_DECISIONS)
+# cachetools caches are not thread-safe, and requests are served from a thread pool; reads take a
+# single get() under the lock so an eviction cannot land between a membership check and the read
+store_lock = threading.Lock()
+
+def get_stored_decision(decision_id):
+    """Return the stored decision for decision_id, or None if unknown or evicted."""
+    with store_lock:
+        return decisions.get(decision_id)
+
+@dataclass(frozen=True, slots=True)
+class SampleApplication:
+    """Immutable sample loan application record."""
+    id: str
+    amount: int
+    purpose: str
+    grade: str
 
 # Load sample applications
 def load_sample_applications():
     return [
-        {
-            "id": "LC_1001",
-            "amount": 10000,
-            "purpose": "debt_consolidation",
-            "grade": "A"
-        },
-        {
-            "id": "LC_1002",
-            "amount": 20000,
-            "purpose": "home_improvement",
-            "grade": "C"
-        },
-        {
-            "id": "LC_1003",
-            "amount": 15000,
-            "purpose": "major_purchase",
-            "grade": "B"
-        },
-        {
-            "id": "LC_1004",
-            "amount": 30000,
-            "purpose": "debt_consolidation",
-            "grade": "E"
-        },
-        {
-            "id": "LC_1005",
-            "amount": 5000,
-            "purpose": "credit_card",
-            "grade": "A"
-        }
+        SampleApplication(id="LC_1001", amount=10000, purpose="debt_consolidation", grade="A"),
+        SampleApplication(id="LC_1002", amount=20000, purpose="home_improvement", grade="C"),
+        SampleApplication(id="LC_1003", amount=15000, purpose="major_purchase", grade="B"),
+        SampleApplication(id="LC_1004", amount=30000, purpose="debt_consolidation", grade="E"),
+        SampleApplication(id="LC_1005", amount=5000, purpose="credit_card", grade="A")
     ]
 
+def ojsonify(obj, status=200):
+    """Serialize a response payload with orjson instead of Flask's stdlib-json jsonify."""
+    return app.response_class(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), status=status, mimetype="application/json")
+
+def parse_json_body():
+    """Parse the raw request body with orjson; returns None if it is not a JSON object."""
+    try:
+        data = orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+# Sample applications are loaded once at import and indexed by ID for O(1) lookup, with each
+# record's dict form built here rather than per evaluation request
+applications = load_sample_applications()
+application_index = {application.id: asdict(application) for application in applications}
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    return jsonify({"status": "healthy", "timestamp": time.time()})
+    return ojsonify({"status": "healthy", "timestamp": time.time()})
 
 @app.route('/api/applications', methods=['GET'])
 def get_applications():
-    global applications
-    if not applications:
-        applications = load_sample_applications()
-    return jsonify(applications)
+    # orjson serializes the dataclass records natively
+    return ojsonify(applications)
 
 @app.route('/api/evaluate/<application_id>/<framework>', methods=['POST'])
 def evaluate_application(application_id, framework):
-    global applications, decisions
-    
     # Find the application
-    app_list = applications if applications else load_sample_applications()
-    application = next((app for app in app_list if app["id"] == application_id), None)
+    application = application_index.get(application_id)
     
     if not application:
-        return jsonify({"error": "Application not found"}), 404
+        return ojsonify({"error": "Application not found"}), 404
     
     # Log the start of evaluation
     analysis_logger.log_event(
@@ -96,12 +117,14 @@ def evaluate_application(application_id, framework):
         decision_id = f"decision_{application_id}_{framework}"
         
         # Store the decision
-        decisions[decision_id] = {
-            "application": application,
-            "framework": framework,
-            "result": result,
-            "timestamp": time.time()
-        }
+        with store_lock:
+            decisions[decision_id] = {
+                "application": application,
+                "framework": framework,
+                "result": result,
+                "timestamp": time.time()
+            }
+            report_paths.pop(decision_id, None)
         
         # Log the completion of evaluation
         analysis_logger.log_event(
@@ -110,7 +133,7 @@ def evaluate_application(application_id, framework):
             {"application_id": application_id, "framework": framework, "decision_id": decision_id, "result": result}
         )
         
-        return jsonify({
+        return ojsonify({
             "decision_id": decision_id,
             "result": result
         })
@@ -121,23 +144,27 @@ def evaluate_application(application_id, framework):
             f"Error evaluating application {application_id}: {str(e)}",
             {"application_id": application_id, "framework": framework, "error": str(e)}
         )
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}), 500
 
 @app.route('/api/decision/<decision_id>', methods=['GET'])
 def get_decision(decision_id):
-    if decision_id not in decisions:
-        return jsonify({"error": "Decision not found"}), 404
+    decision_data = get_stored_decision(decision_id)
+    if decision_data is None:
+        return ojsonify({"error": "Decision not found"}), 404
     
-    return jsonify(decisions[decision_id])
+    return ojsonify(decision_data)
 
 @app.route('/api/explain', methods=['POST'])
 def explain_decision():
-    data = request.json
+    data = parse_json_body()
+    if data is None:
+        return ojsonify({"error": "Invalid JSON"}), 400
     decision_id = data.get('decision_id')
     query = data.get('query', '')
     
-    if not decision_id or decision_id not in decisions:
-        return jsonify({"error": "Decision not found"}), 404
+    decision_data = get_stored_decision(decision_id) if decision_id else None
+    if decision_data is None:
+        return ojsonify({"error": "Decision not found"}), 404
     
     # Log the explanation request
     analysis_logger.log_event(
@@ -147,9 +174,6 @@ def explain_decision():
     )
     
     try:
-        # Get the decision data
-        decision_data = decisions[decision_id]
-        
         # Generate explanation
         explanation = openai_explainer.explain_decision(decision_data, query)
         
@@ -160,7 +184,7 @@ def explain_decision():
             {"decision_id": decision_id, "query": query}
         )
         
-        return jsonify({"explanation": explanation})
+        return ojsonify({"explanation": explanation})
     except Exception as e:
         # Log the error
         analysis_logger.log_event(
@@ -168,17 +192,20 @@ def explain_decision():
             f"Error generating explanation for decision {decision_id}: {str(e)}",
             {"decision_id": decision_id, "query": query, "error": str(e)}
         )
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}), 500
 
 @app.route('/api/chat', methods=['POST'])
 def chat():
-    data = request.json
+    data = parse_json_body()
+    if data is None:
+        return ojsonify({"error": "Invalid JSON"}), 400
     message = data.get('message', '')
     session_id = data.get('session_id', str(uuid.uuid4()))
     context = data.get('context', {})
     
     # Store or update session context
-    session_contexts[session_id] = context
+    with store_lock:
+        session_contexts[session_id] = context
     
     # Log the chat request
     analysis_logger.log_event(
@@ -190,8 +217,8 @@ def chat():
     try:
         # Get relevant decision context if available
         decision_context = None
-        if 'decision_id' in context and context['decision_id'] in decisions:
-            decision_context = decisions[context['decision_id']]
+        if 'decision_id' in context:
+            decision_context = get_stored_decision(context['decision_id'])
         
         # Process the chat message
         response, success = openai_explainer.chat(message, session_id, context)
@@ -203,7 +230,7 @@ def chat():
             {"session_id": session_id, "success": success}
         )
         
-        return jsonify({"response": response, "session_id": session_id})
+        return ojsonify({"response": response, "session_id": session_id})
     except Exception as e:
         # Log the error
         analysis_logger.log_event(
@@ -211,7 +238,7 @@ def chat():
             f"Error processing chat message: {str(e)}",
             {"session_id": session_id, "message": message, "error": str(e)}
         )
-        return jsonify({
+        return ojsonify({
             "response": "I apologize, but I'm having trouble processing your request. Please try again in a moment.",
             "session_id": session_id
         }), 500
@@ -225,12 +252,13 @@ def get_logs():
     # Get logs
     logs = analysis_logger.get_logs(log_type, limit)
     
-    return jsonify(logs)
+    return ojsonify(logs)
 
 @app.route('/api/report/<decision_id>', methods=['GET'])
 def generate_report(decision_id):
-    if decision_id not in decisions:
-        return jsonify({"error": "Decision not found"}), 404
+    decision_data = get_stored_decision(decision_id)
+    if decision_data is None:
+        return ojsonify({"error": "Decision not found"}), 404
     
     # Log the report generation request
     analysis_logger.log_event(
@@ -240,11 +268,13 @@ def generate_report(decision_id):
     )
     
     try:
-        # Get the decision data
-        decision_data = decisions[decision_id]
-        
-        # Generate the report
-        report_path = pdf_generator.generate_report(decision_data)
+        # Generate the report, reusing the previous one for this decision if it is still on disk
+        with store_lock:
+            report_path = report_paths.get(decision_id)
+        if report_path is None or not os.path.exists(report_path):
+            report_path = pdf_generator.generate_report(decision_data)
+            with store_lock:
+                report_paths[decision_id] = report_path
         
         # Log the report generation completion
         analysis_logger.log_event(
@@ -261,7 +291,7 @@ def generate_report(decision_id):
             f"Error generating report for decision {decision_id}: {str(e)}",
             {"decision_id": decision_id, "error": str(e)}
         )
-        return jsonify({"error": str(e)}), 500
+        return ojsonify({"error": str(e)}), 500
 
 # Alias for the report endpoint to match frontend expectations
 @app.route('/api/generate-report/<decision_id>', methods=['GET'])
@@ -269,8 +299,7 @@ def generate_report_alias(decision_id):
     return generate_report(decision_id)
 
 if __name__ == '__main__':
-    # Load sample applications
-    applications = load_sample_applications()
+    import uvicorn
     
     # Start the server
-    app.run(host='0.0.0.0', port=8001, debug=True)
+    uvicorn.run(asgi_app, host='0.0.0.0', port=8001, loop='uvloop', http='httptools', access_log=False, log_level='warning')
@@ -9,7 +9,8 @@ class GovernanceCore:
     def execute_loop(self, plan_input: dict, operator_override_signal: dict | None = None) -> tuple[dict, dict, dict]:
         """Mocks the execution of the governance core loop, now with more detailed override logging."""
         loop_id = str(uuid.uuid4())
-        timestamp = datetime.datetime.utcnow().isoformat() + "Z"
+        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat().replace("+00:00", "Z")
+        ovr = operator_override_signal or {}
 
         # Mock direct output
         core_output = {
@@ -33,7 +34,7 @@ class GovernanceCore:
         justification_log = {
             "agent_id": self.agent_id,
             "timestamp": timestamp,
-            "plan_id": plan_input.get("plan_id", "mock_plan_id_" + str(uuid.uuid4())),
+            "plan_id": plan_input["plan_id"] if "plan_id" in plan_input else "mock_plan_id_" + str(uuid.uuid4()),
             "loop_id": loop_id,
             "decision_outcome": "MOCK_ACCEPTED",
             "rejection_reason": None,
@@ -47,14 +48,14 @@ class GovernanceCore:
             },
             # Phase 2.2: Enhanced override details in justification log
             "override_active": operator_override_signal is not None,
-            "override_type": operator_override_signal.get("override_type") if operator_override_signal else None,
-            "override_reason": operator_override_signal.get("reason") if operator_override_signal else None,
-            "override_parameters": operator_override_signal.get("parameters") if operator_override_signal else None,
-            "override_issuing_operator_id": operator_override_signal.get("issuing_operator_id") if operator_override_signal else None
+            "override_type": ovr.get("override_type"),
+            "override_reason": ovr.get("reason"),
+            "override_parameters": ovr.get("parameters"),
+            "override_issuing_operator_id": ovr.get("issuing_operator_id")
         }
         
         # If an override is active, it might change the decision outcome for example
-        if operator_override_signal and operator_override_signal.get("override_type") == "FORCE_REJECT": # Example custom type
+        if ovr.get("override_type") == "FORCE_REJECT": # Example custom type
             justification_log["decision_outcome"] = "MOCK_FORCED_REJECTION_DUE_TO_OVERRIDE"
             core_output["status"] = "mock_forced_rejection"
             core_output["details"] = "GovernanceCore mock execution was overridden to REJECT."
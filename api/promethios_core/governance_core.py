@@ -3,13 +3,18 @@
 
 """governance_core.py: Core governance module for Promethios implementing trust logic, override handling, and justification mapping."""
 
+import atexit
+import collections
 import json
+import orjson
 import os
+import queue
+import threading
 import uuid
 import time
 import hashlib
-from datetime import datetime
-import jsonschema
+import fastjsonschema
+from functools import lru_cache
 
 # Get the absolute path of the repository root directory
 REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -30,6 +35,23 @@ EMOTION_TELEMETRY_SCHEMA = os.path.join(SCHEMA_DIR, "mgc_emotion_telemetry.schem
 JUSTIFICATION_LOG_SCHEMA = os.path.join(SCHEMA_DIR, "loop_justification_log.schema.v1.json")
 OPERATOR_OVERRIDE_SCHEMA = os.path.join(SCHEMA_DIR, "operator_override.schema.v1.json")
 
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) for the most recent timestamp
+_timestamp_prefix_cache = (None, "")
+
+def _utc_timestamp():
+    """Return the current UTC time as an ISO 8601 string with microseconds and a Z suffix.
+    
+    The second-precision prefix is formatted once per second and reused; only the
+    microsecond fraction is formatted on each call.
+    """
+    global _timestamp_prefix_cache
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _timestamp_prefix_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _timestamp_prefix_cache = (seconds, prefix)
+    return f"{prefix}.{nanoseconds // 1000:06d}Z"
+
 def calculate_entry_hash(entry_dict):
     """Calculate SHA256 hash for a log entry.
     
@@ -39,18 +61,186 @@ def calculate_entry_hash(entry_dict):
     Returns:
         String containing the hex digest of the SHA256 hash
     """
-    # Create a copy of the entry to avoid modifying the original
-    entry_copy = entry_dict.copy()
-    
-    # Remove the hash field if it exists
-    if 'entry_sha256_hash' in entry_copy:
-        del entry_copy['entry_sha256_hash']
+    # Only copy when the hash field is present; entries being logged don't carry it yet
+    if 'entry_sha256_hash' in entry_dict:
+        entry_dict = {key: value for key, value in entry_dict.items() if key != 'entry_sha256_hash'}
         
-    # Sort keys for deterministic serialization
-    entry_json = json.dumps(entry_copy, sort_keys=True)
+    # Sort keys for deterministic serialization (compact UTF-8 bytes, hashed directly)
+    entry_json = orjson.dumps(entry_dict, option=orjson.OPT_SORT_KEYS)
     
     # Calculate hash
-    return hashlib.sha256(entry_json.encode('utf-8')).hexdigest()
+    return hashlib.sha256(entry_json).hexdigest()
+
+def encode_hashed_entry(entry_dict):
+    """Serialize a log entry once, returning its hash and the JSONL line carrying that hash.
+    
+    The canonical sorted-key bytes are hashed, then the hash field is spliced in before the
+    closing brace, so the line does not need a second serialization pass.
+    
+    Args:
+        entry_dict: Dictionary containing the log entry data (without hash field)
+        
+    Returns:
+        Tuple of (hex digest of the SHA256 hash, encoded log line ending in a newline)
+    """
+    entry_json = orjson.dumps(entry_dict, option=orjson.OPT_SORT_KEYS)
+    entry_hash = hashlib.sha256(entry_json).hexdigest()
+    return entry_hash, b''.join((entry_json[:-1], b',"entry_sha256_hash":"', entry_hash.encode('ascii'), b'"}\n'))
+
+def _load_schemas():
+    """Load JSON schemas for validation and compile a validator for each output type."""
+    try:
+        with open(EMOTION_TELEMETRY_SCHEMA, 'r') as f:
+            emotion_telemetry_schema = json.load(f)
+        
+        with open(JUSTIFICATION_LOG_SCHEMA, 'r') as f:
+            justification_log_schema = json.load(f)
+        
+        with open(OPERATOR_OVERRIDE_SCHEMA, 'r') as f:
+            operator_override_schema = json.load(f)
+        
+        # Compile each schema once; validation then runs generated code instead of re-walking the schema
+        validators = {
+            "emotion_telemetry": fastjsonschema.compile(emotion_telemetry_schema),
+            "justification_log": fastjsonschema.compile(justification_log_schema),
+            "operator_override": fastjsonschema.compile(operator_override_schema)
+        }
+        
+        print(f"Schemas loaded successfully from {SCHEMA_DIR}")
+        return emotion_telemetry_schema, justification_log_schema, operator_override_schema, validators
+    except FileNotFoundError as e:
+        print(f"CRITICAL: Schema file not found: {e}")
+        raise
+    except json.JSONDecodeError as e:
+        print(f"CRITICAL: Invalid schema JSON: {e}")
+        raise
+    except fastjsonschema.JsonSchemaDefinitionException as e:
+        print(f"CRITICAL: Invalid schema definition: {e}")
+        raise
+
+_EMOTION_TELEMETRY_SCHEMA, _JUSTIFICATION_LOG_SCHEMA, _OPERATOR_OVERRIDE_SCHEMA, _VALIDATORS = _load_schemas()
+
+# Telemetry and justification entries carry fresh timestamps and IDs, so only override
+# signals (replayed on retries and idempotent re-submissions) are worth memoizing.
+_MEMOIZED_OUTPUT_TYPES = frozenset({"operator_override"})
+
+@lru_cache(maxsize=4096)
+def _cached_validation_error(output_type, canonical_data):
+    """Validate canonical JSON bytes, returning the error message or None if valid."""
+    try:
+        _VALIDATORS[output_type](orjson.loads(canonical_data))
+        return None
+    except fastjsonschema.JsonSchemaValueException as e:
+        return str(e)
+
+class LogWriteError(RuntimeError):
+    """Raised when log entries could not be written; the hash-chained log is incomplete from that point."""
+
+class _LogWriter:
+    """Append log lines to a file from a dedicated background thread, preserving order."""
+    
+    def __init__(self, path):
+        self.path = path
+        self._queue = queue.SimpleQueue()
+        self._error = None
+        # O_APPEND keeps each batch one contiguous append. The hash chain's previous-entry hash lives in
+        # this process's memory, so only a single process may write to a given log file.
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._thread = threading.Thread(target=self._run, name=f"log-writer-{os.path.basename(path)}", daemon=True)
+        self._thread.start()
+    
+    @property
+    def closed(self):
+        return not self._thread.is_alive()
+    
+    def _raise_if_failed(self):
+        if self._error is not None:
+            raise LogWriteError(f"Writing to {self.path} failed; entries from that point on were not logged") from self._error
+    
+    def write(self, line):
+        """Queue an encoded log line for writing, raising LogWriteError if an earlier write failed."""
+        self._raise_if_failed()
+        self._queue.put(line)
+    
+    def flush(self):
+        """Block until every line queued so far has been written, raising LogWriteError if any write failed."""
+        if self._thread.is_alive():
+            written = threading.Event()
+            self._queue.put(written)
+            # Stop waiting if the writer thread exits (e.g. on a write error) before reaching the marker
+            while not written.wait(0.1) and self._thread.is_alive():
+                pass
+        self._raise_if_failed()
+    
+    def close(self):
+        """Drain pending lines, then close the file."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_if_failed()
+    
+    def _write_all(self, lines):
+        data = memoryview(b"".join(lines))
+        while data:
+            data = data[os.write(self._fd, data):]
+    
+    def _run(self):
+        try:
+            self._drain()
+        except Exception as e:
+            # Keep the error for write()/flush()/close() to raise; nothing queued after it is written
+            self._error = e
+            print(f"CRITICAL: Log writer for {self.path} failed: {e}")
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+    
+    def _drain(self):
+        while True:
+            # Block for the next item, then drain whatever else is queued into one write
+            batch = [self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            lines = []
+            for item in batch:
+                if isinstance(item, bytes):
+                    lines.append(item)
+                    continue
+                # Flush marker or stop sentinel: everything queued before it must reach the file first
+                self._write_all(lines)
+                lines = []
+                if item is None:
+                    os.close(self._fd)
+                    return
+                item.set()
+            self._write_all(lines)
+
+# One writer per log path, shared by every GovernanceCore instance in the process
+_log_writers = {}
+_log_writers_lock = threading.Lock()
+
+def _get_log_writer(path):
+    """Return the shared writer for a log path, starting it on first use."""
+    with _log_writers_lock:
+        writer = _log_writers.get(path)
+        if writer is not None:
+            # Never replace a failed writer: appending through a new one would hide the gap in the hash chain
+            writer._raise_if_failed()
+        if writer is None or writer.closed:
+            writer = _log_writers[path] = _LogWriter(path)
+        return writer
+
+@atexit.register
+def _close_log_writers():
+    with _log_writers_lock:
+        writers = list(_log_writers.values())
+        _log_writers.clear()
+    for writer in writers:
+        try:
+            writer.close()
+        except LogWriteError as e:
+            print(f"CRITICAL: {e}")
 
 class GovernanceCore:
     """Core governance module implementing trust logic, override handling, and justification mapping."""
@@ -59,9 +249,24 @@ class GovernanceCore:
     DEFAULT_TRUST_SCORE = 0.75
     TRUST_THRESHOLD = 0.3
     AGENT_ID = "promethios_governance_core"
+    # Accepts an emit callback that receives each logged entry as {"kind": ..., "data": entry}
+    supports_emit = True
+    # Most recent justification entries kept in memory; the full history lives in the log file
+    MAX_JUSTIFICATION_LOG_ENTRIES = 1000
+    SCHEMA_VERSIONS = {
+        "emotion_telemetry": "1.2.0",
+        "justification_log": "1.2.0"
+    }
+    # Map decision to decision_outcome format required by schema
+    DECISION_OUTCOME_MAP = {
+        "ACCEPTED": "ACCEPTED",
+        "REJECTED": "REJECTED",
+        "ACCEPTED_WITH_OVERRIDE": "ACCEPTED_WITH_OVERRIDE"
+    }
     
-    def __init__(self):
-        """Initialize the governance core with default state."""
+    def __init__(self, emit=None):
+        """Initialize the governance core with default state and an optional log-entry callback."""
+        self._emit_callback = emit
         # Track the last hash for each log file to enable chain integrity
         self.last_emotion_hash = None
         self.last_justification_hash = None
@@ -74,53 +279,55 @@ class GovernanceCore:
             "trigger_id": "initialization",
             "contributing_factors": []
         }
-        self.justification_log = []
-        self.schema_versions = {
-            "emotion_telemetry": "1.2.0",
-            "justification_log": "1.2.0"
-        }
-        self._load_schemas()
+        self.justification_log = collections.deque(maxlen=self.MAX_JUSTIFICATION_LOG_ENTRIES)
+        self.schema_versions = self.SCHEMA_VERSIONS
+        # Schemas are parsed and compiled once at import and shared by every instance
+        self.emotion_telemetry_schema = _EMOTION_TELEMETRY_SCHEMA
+        self.justification_log_schema = _JUSTIFICATION_LOG_SCHEMA
+        self.operator_override_schema = _OPERATOR_OVERRIDE_SCHEMA
+        self._validators = _VALIDATORS
+        self._open_log_files()
         self._emit_emotion_telemetry(self.current_emotion_state)
         print(f"GovernanceCore v{self.VERSION} initialized at canonical location")
     
-    def _load_schemas(self):
-        """Load JSON schemas for validation."""
-        try:
-            with open(EMOTION_TELEMETRY_SCHEMA, 'r') as f:
-                self.emotion_telemetry_schema = json.load(f)
-            
-            with open(JUSTIFICATION_LOG_SCHEMA, 'r') as f:
-                self.justification_log_schema = json.load(f)
-            
-            with open(OPERATOR_OVERRIDE_SCHEMA, 'r') as f:
-                self.operator_override_schema = json.load(f)
-            
-            print(f"Schemas loaded successfully from {SCHEMA_DIR}")
-        except FileNotFoundError as e:
-            print(f"CRITICAL: Schema file not found: {e}")
-            raise
-        except json.JSONDecodeError as e:
-            print(f"CRITICAL: Invalid schema JSON: {e}")
-            raise
+    def _open_log_files(self):
+        """Attach to the shared background writers so disk I/O stays off the request path."""
+        self._emotion_log_writer = _get_log_writer(EMOTION_TELEMETRY_LOG)
+        self._justification_log_writer = _get_log_writer(JUSTIFICATION_LOG)
+    
+    def flush_logs(self):
+        """Block until every entry logged so far is on disk; call before reading or verifying the logs."""
+        self._emotion_log_writer.flush()
+        self._justification_log_writer.flush()
+    
+    def close_logs(self):
+        """Write out any queued log entries. The shared writers are closed at interpreter exit."""
+        self.flush_logs()
     
     def _get_timestamp(self):
         """Get current timestamp in ISO format."""
-        return datetime.utcnow().isoformat() + "Z"
+        return _utc_timestamp()
     
     def _validate_output(self, data, output_type):
         """Validate output data against schema."""
+        validator = self._validators.get(output_type)
+        if validator is None:
+            print(f"WARNING: Unknown output type for validation: {output_type}")
+            return False
+        if output_type in _MEMOIZED_OUTPUT_TYPES:
+            try:
+                canonical_data = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+            except orjson.JSONEncodeError:
+                canonical_data = None
+            if canonical_data is not None:
+                error = _cached_validation_error(output_type, canonical_data)
+                if error is not None:
+                    print(f"VALIDATION ERROR: {error}")
+                return error is None
         try:
-            if output_type == "emotion_telemetry":
-                jsonschema.validate(instance=data, schema=self.emotion_telemetry_schema)
-            elif output_type == "justification_log":
-                jsonschema.validate(instance=data, schema=self.justification_log_schema)
-            elif output_type == "operator_override":
-                jsonschema.validate(instance=data, schema=self.operator_override_schema)
-            else:
-                print(f"WARNING: Unknown output type for validation: {output_type}")
-                return False
+            validator(data)
             return True
-        except jsonschema.exceptions.ValidationError as e:
+        except fastjsonschema.JsonSchemaValueException as e:
             print(f"VALIDATION ERROR: {e}")
             return False
     
@@ -134,22 +341,21 @@ class GovernanceCore:
             if self.last_emotion_hash is not None:
                 entry["previous_entry_hash"] = self.last_emotion_hash
             
-            # Calculate and add the hash
-            entry["entry_sha256_hash"] = calculate_entry_hash(entry)
+            # Calculate and add the hash, serializing the log line in the same pass
+            entry["entry_sha256_hash"], log_line = encode_hashed_entry(entry)
             
-            # Update the last hash
+            # Write to log file first (raises LogWriteError if the log is broken), then advance the chain
+            self._emotion_log_writer.write(log_line)
             self.last_emotion_hash = entry["entry_sha256_hash"]
-            
-            # Write to log file
-            with open(EMOTION_TELEMETRY_LOG, 'a') as f:
-                f.write(json.dumps(entry) + "\n")
+            if self._emit_callback is not None:
+                self._emit_callback({"kind": "emotion_telemetry", "data": entry})
             
             print(f"Emotion telemetry logged: {entry['current_emotion_state']} (trust: {entry['trust_score']}, hash: {entry['entry_sha256_hash'][:8]}...)")
         else:
             print(f"CRITICAL: Failed to validate emotion telemetry. Logging aborted. Data: {json.dumps(emotion_state, indent=2)}")
     
-    def update_emotion_state(self, emotion, intensity, trigger_id, factors=None):
-        """Update the current emotion state."""
+    def update_emotion_state(self, emotion, intensity, trigger_id, factors=None, timestamp=None):
+        """Update the current emotion state, stamping it with timestamp if provided."""
         prev_state = self.current_emotion_state.copy()
         
         # Create contributing factors array if provided
@@ -162,7 +368,7 @@ class GovernanceCore:
                 })
         
         self.current_emotion_state = {
-            "timestamp": self._get_timestamp(),
+            "timestamp": timestamp or self._get_timestamp(),
             "current_emotion_state": emotion,
             "intensity": intensity,
             "trust_score": prev_state.get("trust_score", self.DEFAULT_TRUST_SCORE),
@@ -182,7 +388,7 @@ class GovernanceCore:
         print(f"Valid override signal received: {override_signal.get('override_type')} from {override_signal.get('issuing_operator_id')}")
         return True
     
-    def process_plan(self, plan_id, plan_details, override_signal_info=None):
+    def process_plan(self, plan_id, plan_details, override_signal_info=None, timestamp=None):
         """Process a plan and determine if it should be accepted or rejected."""
         trust_score = self.current_emotion_state.get("trust_score", self.DEFAULT_TRUST_SCORE)
         
@@ -215,7 +421,8 @@ class GovernanceCore:
                 decision="REJECTED" if not override_applied else "ACCEPTED_WITH_OVERRIDE",
                 rejection_reason=rejection_reason,
                 override_required=override_required,
-                override_details=override_signal_info if override_applied else None
+                override_details=override_signal_info if override_applied else None,
+                timestamp=timestamp
             )
             
             if not override_applied:
@@ -232,7 +439,8 @@ class GovernanceCore:
             decision="ACCEPTED",
             rejection_reason=None,
             override_required=False,
-            override_details=None
+            override_details=None,
+            timestamp=timestamp
         )
         
         return {
@@ -241,24 +449,17 @@ class GovernanceCore:
             "trust_score": trust_score
         }
     
-    def _log_justification(self, plan_id, trust_score, decision, rejection_reason, override_required, override_details):
+    def _log_justification(self, plan_id, trust_score, decision, rejection_reason, override_required, override_details, timestamp=None):
         """Log justification for plan decision with embedded hash."""
-        # Map decision to decision_outcome format required by schema
-        decision_outcome_map = {
-            "ACCEPTED": "ACCEPTED",
-            "REJECTED": "REJECTED",
-            "ACCEPTED_WITH_OVERRIDE": "ACCEPTED_WITH_OVERRIDE"
-        }
-        
         log_entry = {
             "agent_id": self.AGENT_ID,
-            "timestamp": self._get_timestamp(),
-            "entry_id": f"justification_{str(uuid.uuid4())}",
+            "timestamp": timestamp or self._get_timestamp(),
+            "entry_id": f"justification_{uuid.uuid4()}",
             "plan_id": plan_id,
-            "loop_id": "loop_placeholder_" + str(uuid.uuid4())[:8],
+            "loop_id": "loop_placeholder_" + uuid.uuid4().hex[:8],
             "trust_score_at_decision": trust_score,
             "emotion_state_at_decision": self.current_emotion_state.get("current_emotion_state", "NEUTRAL"),
-            "decision_outcome": decision_outcome_map.get(decision, "UNKNOWN"),
+            "decision_outcome": self.DECISION_OUTCOME_MAP.get(decision, "UNKNOWN"),
             "rejection_reason": rejection_reason,
             "override_required": override_required,
             "validation_passed": True,
@@ -273,17 +474,16 @@ class GovernanceCore:
             if self.last_justification_hash is not None:
                 log_entry["previous_entry_hash"] = self.last_justification_hash
             
-            # Calculate and add the hash
-            log_entry["entry_sha256_hash"] = calculate_entry_hash(log_entry)
+            # Calculate and add the hash, serializing the log line in the same pass
+            log_entry["entry_sha256_hash"], log_line = encode_hashed_entry(log_entry)
             
-            # Update the last hash
+            # Write to log file first (raises LogWriteError if the log is broken), then advance the chain
+            self._justification_log_writer.write(log_line)
             self.last_justification_hash = log_entry["entry_sha256_hash"]
             
             self.justification_log.append(log_entry)
-            
-            # Write to log file
-            with open(JUSTIFICATION_LOG, 'a') as f:
-                f.write(json.dumps(log_entry) + "\n")
+            if self._emit_callback is not None:
+                self._emit_callback({"kind": "justification_log", "data": log_entry})
             
             print(f"Logging Validated Justification: Decision={decision}, Hash={log_entry['entry_sha256_hash'][:8]}...")
         else:
@@ -291,9 +491,13 @@ class GovernanceCore:
     
     def execute_loop(self, loop_input):
         """Execute a governance loop with the given input."""
-        loop_id = loop_input.get("loop_id", "loop_" + str(uuid.uuid4())[:8])
+        # One timestamp per loop, shared by every entry the loop logs
+        timestamp = self._get_timestamp()
+        loop_id = loop_input.get("loop_id")
+        if loop_id is None:
+            loop_id = "loop_" + uuid.uuid4().hex[:8]
         print(f"Executing loop_id: {loop_id} with input: {loop_input}")
-        self.update_emotion_state("NEUTRAL", 0.5, trigger_id=f"loop_start_{loop_id}", factors=[{"factor_type": "initialization", "factor_value": 0.5}])
+        self.update_emotion_state("NEUTRAL", 0.5, trigger_id=f"loop_start_{loop_id}", factors=[{"factor_type": "initialization", "factor_value": 0.5}], timestamp=timestamp)
         
         override_signal_data = loop_input.get("operator_override_signal")
         override_signal_info_for_plan = None
@@ -308,23 +512,16 @@ class GovernanceCore:
             else:
                 override_signal_info_for_plan = {"valid": False, "id": None, "type": None}
         
-        plan_id = loop_input.get("plan_id", "plan_" + str(uuid.uuid4())[:4])
+        plan_id = loop_input.get("plan_id")
+        if plan_id is None:
+            plan_id = "plan_" + uuid.uuid4().hex[:4]
         plan_details = loop_input.get("plan_details", {})
         
         if "trust_score" not in self.current_emotion_state:
             self.current_emotion_state["trust_score"] = self.DEFAULT_TRUST_SCORE
             self._emit_emotion_telemetry(self.current_emotion_state)
         
-        result = self.process_plan(plan_id, plan_details, override_signal_info=override_signal_info_for_plan)
-        
-        loop_output = {
-            "loop_id": loop_id,
-            "plan_id": plan_id,
-            "status": result.get("status"),
-            "reason": result.get("reason"),
-            "final_emotion_state": self.current_emotion_state,
-            "justification_log_entries": [entry for entry in self.justification_log if entry.get("loop_id") == "loop_placeholder_" + str(uuid.uuid4())[:8] or entry.get("plan_id") == plan_id]
-        }
+        result = self.process_plan(plan_id, plan_details, override_signal_info=override_signal_info_for_plan, timestamp=timestamp)
         
         return result
 
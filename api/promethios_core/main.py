@@ -1,24 +1,25 @@
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+import fastjsonschema # Compiled validator for the request body
 import json
-import jsonschema # For request validation
+import orjson # Fast request body parsing
 import os
 import uuid
 
-from runtime_executor import RuntimeExecutor, load_schema # Assuming runtime_executor.py is in the same directory or accessible
+from runtime_executor import RuntimeExecutor, load_schema, SCHEMA_BASE_PATH, MGC_SCHEMA_PATH # Assuming runtime_executor.py is in the same directory or accessible
 
 # --- FastAPI App Initialization --- #
 app = FastAPI(
     title="Promethios Governance Core Runtime",
     version="2.1.0",
-    description="HTTP API for executing the Promethios GovernanceCore loop."
+    description="HTTP API for executing the Promethios GovernanceCore loop.",
+    default_response_class=ORJSONResponse
 )
 
 # --- Schema Loading for Request Validation --- #
-# These paths assume main.py is in the root of promethios_repo
-SCHEMA_BASE_PATH = os.path.join(os.path.dirname(__file__), "ResurrectionCodex")
+# SCHEMA_BASE_PATH and MGC_SCHEMA_PATH are shared with runtime_executor so the Codex layout is resolved in one place
 API_SCHEMA_PATH = os.path.join(SCHEMA_BASE_PATH, "02_System_Architecture", "API_Schemas")
-MGC_SCHEMA_PATH = os.path.join(SCHEMA_BASE_PATH, "01_Minimal_Governance_Core_MGC", "MGC_Schema_Registry")
 
 LOOP_EXECUTE_REQUEST_SCHEMA_PATH = os.path.join(API_SCHEMA_PATH, "loop_execute_request.v1.schema.json")
 OPERATOR_OVERRIDE_SCHEMA_PATH = os.path.join(MGC_SCHEMA_PATH, "operator_override.schema.v1.json")
@@ -26,26 +27,42 @@ OPERATOR_OVERRIDE_SCHEMA_PATH = os.path.join(MGC_SCHEMA_PATH, "operator_override
 loop_execute_request_schema = load_schema(LOOP_EXECUTE_REQUEST_SCHEMA_PATH)
 operator_override_schema = load_schema(OPERATOR_OVERRIDE_SCHEMA_PATH)
 
+# The request schemas are fixed for the lifetime of the process, so compile them once
+# into specialised validators instead of walking them with jsonschema per request.
+validate_loop_execute_request = fastjsonschema.compile(loop_execute_request_schema)
+validate_operator_override = fastjsonschema.compile(operator_override_schema)
+
+# Dev-time sanity check: also run the reference jsonschema validator and compare verdicts.
+# jsonschema is only imported when this is enabled, keeping it out of production startup.
+JSONSCHEMA_CROSS_CHECK = os.getenv("PROMETHIOS_JSONSCHEMA_CROSS_CHECK", "").lower() in ("1", "true", "yes")
+
+# Upper bound on /loop/execute request bodies (default 10 MiB)
+MAX_REQUEST_BODY_BYTES = int(os.getenv("PROMETHIOS_MAX_REQUEST_BYTES", str(10 * 1024 * 1024)))
+
 # --- Runtime Executor Instance --- #
 runtime_executor = RuntimeExecutor()
 
 # --- Helper for Schema Validation Error Response --- #
+def _validation_error_details(error, message_prefix=""):
+    # Compiled validator error; path is prefixed with the root name "data"
+    return {
+        "message": f"{message_prefix}{error.message}",
+        "path": list(error.path[1:]) if error.path else [],
+        "validator": error.rule,
+        "validator_value": error.rule_definition
+    }
+
 def create_validation_error_response(errors, status_code=status.HTTP_400_BAD_REQUEST):
     error_details_list = []
-    if isinstance(errors, jsonschema.exceptions.ValidationError):
+    if isinstance(errors, fastjsonschema.JsonSchemaException):
         # Single top-level error
-        error_details_list.append({
-            "message": errors.message,
-            "path": list(errors.path),
-            "validator": errors.validator,
-            "validator_value": errors.validator_value
-        })
+        error_details_list.append(_validation_error_details(errors))
     elif isinstance(errors, list): # List of errors (e.g. from multiple checks)
         error_details_list = errors
     else: # Generic fallback
         error_details_list.append({"message": str(errors)})
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "request_id": "N/A", # Or try to get from request if possible
@@ -61,6 +78,55 @@ def create_validation_error_response(errors, status_code=status.HTTP_400_BAD_REQ
         }
     )
 
+# Reference validators are built lazily (and only once) since they are needed only on the
+# rejection path and for the dev cross-check.
+_reference_validators = {}
+
+def _get_reference_validator(schema_name):
+    validator = _reference_validators.get(schema_name)
+    if validator is None:
+        from jsonschema import Draft7Validator
+        schema = loop_execute_request_schema if schema_name == "loop_execute_request" else operator_override_schema
+        Draft7Validator.check_schema(schema)
+        validator = _reference_validators[schema_name] = Draft7Validator(schema)
+    return validator
+
+def _collect_validation_errors(instance, schema_name, compiled_error, message_prefix=""):
+    # The compiled validator fails fast; report every violation in one pass for rejected requests.
+    errors = sorted(_get_reference_validator(schema_name).iter_errors(instance), key=lambda e: [str(p) for p in e.path])
+    if not errors:
+        return [_validation_error_details(compiled_error, message_prefix)]
+    return [
+        {
+            "message": f"{message_prefix}{e.message}",
+            "path": list(e.path),
+            "validator": e.validator,
+            "validator_value": e.validator_value
+        }
+        for e in errors
+    ]
+
+def _cross_check_request_validation(request_body, expected_valid):
+    # Only used when PROMETHIOS_JSONSCHEMA_CROSS_CHECK is set; flags divergence between validators.
+    reference_valid = _get_reference_validator("loop_execute_request").is_valid(request_body)
+    if reference_valid != expected_valid:
+        print(f"WARNING: Compiled validator verdict ({expected_valid}) differs from jsonschema ({reference_valid}) for request body.")
+
+class RequestBodyTooLarge(Exception):
+    pass
+
+async def _read_request_body(request):
+    # Accumulate chunks into one bytearray (amortised growth) and stop as soon as the cap is exceeded
+    content_length = request.headers.get("content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > MAX_REQUEST_BODY_BYTES:
+        raise RequestBodyTooLarge()
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > MAX_REQUEST_BODY_BYTES:
+            raise RequestBodyTooLarge()
+    return body
+
 # --- API Endpoint: /loop/execute --- #
 @app.post("/loop/execute", 
             # response_model can be defined with Pydantic if schemas are converted,
@@ -71,9 +137,22 @@ def create_validation_error_response(errors, status_code=status.HTTP_400_BAD_REQ
             tags=["Runtime Execution"])
 async def execute_loop(request: Request):
     try:
-        request_body = await request.json()
+        # Parse raw bytes directly; orjson.JSONDecodeError subclasses json.JSONDecodeError
+        request_body = orjson.loads(await _read_request_body(request))
+    except RequestBodyTooLarge:
+        return ORJSONResponse(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            content={
+                "request_id": "N/A",
+                "execution_status": "REJECTED",
+                "error_details": {
+                    "code": "REQUEST_TOO_LARGE",
+                    "message": f"Request body exceeds {MAX_REQUEST_BODY_BYTES} bytes."
+                }
+            }
+        )
     except json.JSONDecodeError:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content={
                 "request_id": "N/A",
@@ -85,36 +164,42 @@ async def execute_loop(request: Request):
             }
         )
 
+    # Codex Checks 1.1 and 1.2 run together so a rejected request reports every violation at once
+    schema_validation_errors = []
+
     # Codex Check 1.1: Validate entire request body
     try:
-        jsonschema.validate(instance=request_body, schema=loop_execute_request_schema)
-    except jsonschema.exceptions.ValidationError as e:
-        return create_validation_error_response(e)
+        validate_loop_execute_request(request_body)
+    except fastjsonschema.JsonSchemaException as e:
+        if JSONSCHEMA_CROSS_CHECK:
+            _cross_check_request_validation(request_body, expected_valid=False)
+        schema_validation_errors.extend(_collect_validation_errors(request_body, "loop_execute_request", e))
     except Exception as e: # Catch other potential errors during validation
         return create_validation_error_response(str(e))
+    else:
+        if JSONSCHEMA_CROSS_CHECK:
+            _cross_check_request_validation(request_body, expected_valid=True)
 
     # Codex Check 1.2: Validate operator_override_signal if present
-    operator_override_signal = request_body.get("operator_override_signal")
+    operator_override_signal = request_body.get("operator_override_signal") if isinstance(request_body, dict) else None
     if operator_override_signal is not None: # Ensure it's not just present but also not null if schema expects object
         try:
-            jsonschema.validate(instance=operator_override_signal, schema=operator_override_schema)
-        except jsonschema.exceptions.ValidationError as e:
+            validate_operator_override(operator_override_signal)
+        except fastjsonschema.JsonSchemaException as e:
             # Specific error for override signal validation failure
-            override_error = {
-                "message": f"Operator override signal failed validation: {e.message}",
-                "path": list(e.path),
-                "validator": e.validator,
-                "validator_value": e.validator_value
-            }
-            return create_validation_error_response([override_error])
+            schema_validation_errors.extend(_collect_validation_errors(operator_override_signal, "operator_override", e, "Operator override signal failed validation: "))
         except Exception as e:
              return create_validation_error_response(str(e))
 
+    if schema_validation_errors:
+        return create_validation_error_response(schema_validation_errors)
+
     # If all input validations pass, proceed to execute the core loop
     # The runtime_executor handles its own output validations and error structuring.
     # Task 2.1.5.1: Logging within runtime_executor
     # Task 2.1.6 & Codex Checks 5.1, 5.2, 5.3 are handled by runtime_executor and GC structure
-    response_data = runtime_executor.execute_core_loop(request_body)
+    # The kernel call is synchronous (stdout capture + file logging); keep it off the event loop
+    response_data = await run_in_threadpool(runtime_executor.execute_core_loop, request_body)
     
     # Determine status code based on execution_status from executor
     # This is a simple mapping, could be more nuanced
@@ -124,16 +209,34 @@ async def execute_loop(request: Request):
     elif response_data.get("execution_status") == "REJECTED":
         response_status_code = status.HTTP_400_BAD_REQUEST # Should have been caught earlier, but as a fallback
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=response_status_code,
         content=response_data
     )
 
 # --- Root Endpoint for Health Check (Optional) --- #
-@app.get("/", summary="Health Check", tags=["System"])
+ROOT_RESPONSE_JSON = orjson.dumps({"message": "Promethios Governance Core Runtime is active."})
+
+@app.get("/", summary="Health Check", tags=["System"], response_class=Response)
 async def root():
-    return {"message": "Promethios Governance Core Runtime is active."}
+    # Static payload, serialized once at import
+    return Response(content=ROOT_RESPONSE_JSON, media_type="application/json")
 
 # --- To run locally (for development) --- #
 # uvicorn main:app --reload --port 8000
 
+if __name__ == "__main__":
+    import uvicorn
+    # uvloop + httptools (from uvicorn[standard]) rather than the asyncio loop and h11 defaults.
+    # Reload is opt-in for development (PROMETHIOS_DEV=1). Runs a single worker: the kernel's hash-chained
+    # logs keep the previous entry hash in process memory, so a second process would break the chain.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8002,
+        loop="uvloop",
+        http="httptools",
+        reload=os.getenv("PROMETHIOS_DEV") == "1",
+        access_log=False
+    )
+
@@ -1,13 +1,20 @@
 import json
+import orjson
 import uuid
-import datetime
-import jsonschema
+import time
+import fastjsonschema
 import os
+import re
 import importlib.util
 import sys
 import hashlib
 import io
 import contextlib
+import threading
+import queue
+import atexit
+import weakref
+from functools import lru_cache
 
 # --- Dynamically Import GovernanceCore --- #
 current_file_dir = os.path.dirname(os.path.abspath(__file__))
@@ -48,12 +55,17 @@ if not using_actual_kernel:
 
 module_name = "governance_core_dynamic"
 try:
-    spec = importlib.util.spec_from_file_location(module_name, governance_core_module_path)
-    if spec is None:
-        raise ImportError(f"Could not load spec for module at {governance_core_module_path}")
-    governance_core_module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = governance_core_module
-    spec.loader.exec_module(governance_core_module)
+    # Reuse a kernel already loaded from the same file (e.g. when this module is imported under another name)
+    cached_module = sys.modules.get(module_name)
+    if cached_module is not None and getattr(cached_module, "__file__", None) == governance_core_module_path:
+        governance_core_module = cached_module
+    else:
+        spec = importlib.util.spec_from_file_location(module_name, governance_core_module_path)
+        if spec is None:
+            raise ImportError(f"Could not load spec for module at {governance_core_module_path}")
+        governance_core_module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = governance_core_module
+        spec.loader.exec_module(governance_core_module)
     GovernanceCore = governance_core_module.GovernanceCore
     print(f"INFO: Successfully loaded GovernanceCore from {governance_core_module_path}")
 except Exception as e:
@@ -71,8 +83,8 @@ def load_schema(file_path):
     if not os.path.exists(file_path):
         print(f"Warning: Schema file for output validation not found at {file_path}. Using basic object schema.")
         return {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object"}
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        return orjson.loads(f.read())
 
 EMOTION_TELEMETRY_SCHEMA_PATH = os.path.join(MGC_SCHEMA_PATH, "mgc_emotion_telemetry.schema.json")
 JUSTIFICATION_LOG_SCHEMA_PATH = os.path.join(MGC_SCHEMA_PATH, "loop_justification_log.schema.v1.json")
@@ -80,10 +92,16 @@ JUSTIFICATION_LOG_SCHEMA_PATH = os.path.join(MGC_SCHEMA_PATH, "loop_justificatio
 emotion_telemetry_schema = load_schema(EMOTION_TELEMETRY_SCHEMA_PATH)
 justification_log_schema = load_schema(JUSTIFICATION_LOG_SCHEMA_PATH)
 
+# Compile the output schemas once; every stdout candidate is checked against these validators
+validate_emotion_telemetry = fastjsonschema.compile(emotion_telemetry_schema)
+validate_justification_log = fastjsonschema.compile(justification_log_schema)
+
 DEFAULT_LOG_DIR = os.path.join(current_file_dir, "logs")
 LOGGING_CONFIG_FILE = os.path.join(current_file_dir, "logging.conf.json")
 
+@lru_cache(maxsize=None)
 def get_log_directory():
+    # Resolved once per process; logging.conf.json is read at startup only
     if os.path.exists(LOGGING_CONFIG_FILE):
         try:
             with open(LOGGING_CONFIG_FILE, 'r') as f:
@@ -97,58 +115,171 @@ def get_log_directory():
             return DEFAULT_LOG_DIR
     return DEFAULT_LOG_DIR
 
+def _canonical_json_bytes(data: dict) -> bytes:
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+# Pre-orjson canonical form; differs from _canonical_json_bytes only by escaping non-ASCII text
+_CANONICAL_JSON_ENCODER = json.JSONEncoder(sort_keys=True, separators=(',', ':'))
+
 def _canonical_json_string(data: dict) -> str:
-    return json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return _CANONICAL_JSON_ENCODER.encode(data)
+
+def _calculate_sha256_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def _fast_iso_utc() -> str:
+    # Equivalent to datetime.utcnow().isoformat() + "Z" (always with microseconds), without building a datetime
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    t = time.gmtime(seconds)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.{nanoseconds // 1000:06d}Z"
 
-def _calculate_sha256_hash(text: str) -> str:
-    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+# Shared decoder for JSON payloads embedded in kernel stdout
+_stdout_json_decoder = json.JSONDecoder()
+# Both payload prefixes in one pass; the named group tells which one matched
+_STDOUT_PREFIX_RE = re.compile(r"(?P<emotion>Emitting Emotion Telemetry: )|(?P<justification>Logging Validated Justification: )")
+
+# The kernel is stateful and redirect_stdout swaps the process-wide sys.stdout, so kernel runs from worker threads must not overlap.
+# Output printed by other threads during a captured run still lands in the capture, so nothing printed outside
+# the lock may echo the kernel's log prefixes; kernels with emit support avoid stdout capture altogether.
+_kernel_lock = threading.Lock()
+
+# Executors whose runtime log handles still need flushing at exit; weak so finished executors can be collected
+_live_executors = weakref.WeakSet()
+
+@atexit.register
+def _close_executor_logs():
+    for executor in list(_live_executors):
+        executor.close_logs()
 
 class RuntimeExecutor:
+    # Log directories already created by an earlier instance in this process
+    _ready_log_directories = set()
+
     def __init__(self):
-        self.governance_core = GovernanceCore()
+        if getattr(GovernanceCore, "supports_emit", False):
+            # Kernels with emit support publish their log entries as events instead of printing them
+            self._kernel_events = queue.SimpleQueue()
+            self.governance_core = GovernanceCore(emit=self._kernel_events.put)
+            self._drain_kernel_events() # Discard entries emitted during kernel initialization
+        else:
+            self._kernel_events = None
+            self.governance_core = GovernanceCore()
         self.log_directory = get_log_directory()
-        if not os.path.exists(self.log_directory):
+        if self.log_directory not in RuntimeExecutor._ready_log_directories:
             try:
-                os.makedirs(self.log_directory)
-                print(f"Created log directory: {self.log_directory}")
+                os.makedirs(self.log_directory, exist_ok=True)
+                RuntimeExecutor._ready_log_directories.add(self.log_directory)
             except Exception as e:
                 print(f"Error creating log directory {self.log_directory}: {e}. Logging may fail.")
-        self.emotion_log_file = os.path.join(self.log_directory, "emotion_telemetry.log.jsonl")
-        self.justification_log_file = os.path.join(self.log_directory, "justification.log.jsonl")
+        # The kernel hash-chains its own entries into emotion_telemetry/justification.log.jsonl in the
+        # same directory, so the runtime's request-wrapped copies go to separate files
+        self.emotion_log_file = os.path.join(self.log_directory, "runtime_emotion_telemetry.log.jsonl")
+        self.justification_log_file = os.path.join(self.log_directory, "runtime_justification.log.jsonl")
+        # Long-lived buffered append handles, opened on first write and flushed once per request
+        self._log_handles = {}
+        # Requests run in threadpool workers, so handle creation must not race
+        self._log_handles_lock = threading.Lock()
+        _live_executors.add(self)
+
+    def _drain_kernel_events(self) -> list:
+        events = []
+        while not self._kernel_events.empty():
+            events.append(self._kernel_events.get_nowait())
+        return events
+
+    def _get_log_handle(self, filename: str):
+        fh = self._log_handles.get(filename)
+        if fh is None:
+            with self._log_handles_lock:
+                fh = self._log_handles.get(filename)
+                if fh is None:
+                    fh = self._log_handles[filename] = open(filename, 'ab', buffering=1 << 16)
+        return fh
+
+    def flush_logs(self):
+        with self._log_handles_lock:
+            for fh in self._log_handles.values():
+                fh.flush()
+
+    def close_logs(self):
+        with self._log_handles_lock:
+            for fh in self._log_handles.values():
+                fh.close()
+            self._log_handles.clear()
 
     def _log_to_file(self, data_to_log: dict, filename: str):
         try:
-            content_to_hash = data_to_log.copy()
-            canonical_string = _canonical_json_string(content_to_hash)
-            entry_hash = _calculate_sha256_hash(canonical_string)
-            data_to_log_with_hash = data_to_log.copy()
-            data_to_log_with_hash["entry_sha256_hash"] = entry_hash
-            with open(filename, 'a') as f:
-                f.write(json.dumps(data_to_log_with_hash) + '\n')
+            # Serialize once: hash the canonical bytes, then splice the hash field in before the closing brace
+            canonical = _canonical_json_bytes(data_to_log)
+            entry_hash = _calculate_sha256_hash(canonical)
+            separator = b',' if len(canonical) > 2 else b''
+            self._get_log_handle(filename).write(b''.join((canonical[:-1], separator, b'"entry_sha256_hash":"', entry_hash.encode('ascii'), b'"}\n')))
         except Exception as e:
             print(f"Error writing to log file {filename}: {e}")
 
-    def validate_against_schema(self, instance, schema, schema_name=""):
+    def validate_against_schema(self, instance, validator, schema_name=""):
         try:
-            jsonschema.validate(instance=instance, schema=schema)
+            validator(instance)
             return None
-        except jsonschema.exceptions.ValidationError as e:
+        except fastjsonschema.JsonSchemaValueException as e:
+            # Compiled validator paths are prefixed with the root name "data"
             return {
                 "message": f"Schema validation failed for {schema_name if schema_name else 'output'}: {e.message}",
-                "path": list(e.path),
-                "validator": e.validator,
-                "validator_value": e.validator_value,
+                "path": list(e.path[1:]) if e.path else [],
+                "validator": e.rule,
+                "validator_value": e.rule_definition,
             }
         except Exception as e:
             return {
                 "message": f"Unexpected error during schema validation for {schema_name if schema_name else 'output'}: {str(e)}",
             }
 
+    def _scan_kernel_stdout(self, stdout_full_text: str):
+        """Recover the last valid emotion telemetry and justification log printed by a kernel without emit support."""
+        emotion_telemetry_from_stdout = None
+        justification_log_from_stdout = None
+
+        EMOTION_PREFIX = "Emitting Emotion Telemetry: "
+        JUSTIFICATION_PREFIX = "Logging Validated Justification: "
+
+        # Common case: the kernel printed nothing we can recover, so skip the scan entirely
+        if EMOTION_PREFIX not in stdout_full_text and JUSTIFICATION_PREFIX not in stdout_full_text:
+            return emotion_telemetry_from_stdout, justification_log_from_stdout
+
+        current_pos = 0
+        for prefix_match in _STDOUT_PREFIX_RE.finditer(stdout_full_text):
+            if prefix_match.start() < current_pos:
+                continue # Inside a payload that was already decoded
+            is_emotion = prefix_match.lastgroup == "emotion"
+            json_text_start_offset = prefix_match.end()
+
+            try:
+                # Decode in place from the offset; no copy of the remaining text
+                obj, json_text_end = _stdout_json_decoder.raw_decode(stdout_full_text, json_text_start_offset)
+                if is_emotion:
+                    if self.validate_against_schema(obj, validate_emotion_telemetry, "stdout_emotion_telemetry_candidate") is None:
+                        emotion_telemetry_from_stdout = obj
+                        print(f"DEBUG: Successfully parsed EMOTION telemetry from stdout using raw_decode.")
+                else: # justification
+                    val_error = self.validate_against_schema(obj, validate_justification_log, "stdout_justification_log_candidate")
+                    if val_error is None:
+                        justification_log_from_stdout = obj
+                        print(f"DEBUG: Successfully parsed JUSTIFICATION log from stdout using raw_decode.")
+                    else:
+                        print(f"DEBUG: Failed to validate parsed JUSTIFICATION log from stdout: {val_error}")
+                current_pos = json_text_end
+            except json.JSONDecodeError as e:
+                print(f"DEBUG: JSONDecodeError while parsing from stdout (prefix: {'EMOTION' if is_emotion else 'JUSTIFICATION'}): {e}. Skipping to next potential prefix.")
+
+        return emotion_telemetry_from_stdout, justification_log_from_stdout
+
     def execute_core_loop(self, request_data: dict) -> dict:
-        request_id = request_data.get("request_id", str(uuid.uuid4()))
+        request_id = request_data.get("request_id")
+        if request_id is None:
+            request_id = str(uuid.uuid4())
         plan_input_from_request = request_data.get("plan_input")
         operator_override_signal = request_data.get("operator_override_signal")
-        timestamp_capture = datetime.datetime.utcnow().isoformat() + "Z"
+        timestamp_capture = _fast_iso_utc()
         schema_validation_errors = []
         loop_input_for_kernel = {
             "loop_id": request_id,
@@ -156,89 +287,55 @@ class RuntimeExecutor:
             "operator_override_signal": operator_override_signal
         }
         core_output = None
-        emotion_telemetry_from_stdout = None
-        justification_log_from_stdout = None
+        emotion_telemetry_from_kernel = None
+        justification_log_from_kernel = None
 
         try:
-            captured_stdout_io = io.StringIO()
-            with contextlib.redirect_stdout(captured_stdout_io):
-                core_output = self.governance_core.execute_loop(loop_input_for_kernel)
-            
-            stdout_full_text = captured_stdout_io.getvalue()
-            print(f"DEBUG: Captured stdout from kernel:\n---\n{stdout_full_text}\n---")
-
-            EMOTION_PREFIX = "Emitting Emotion Telemetry: "
-            JUSTIFICATION_PREFIX = "Logging Validated Justification: "
-            decoder = json.JSONDecoder()
-
-            current_pos = 0
-            while current_pos < len(stdout_full_text):
-                emotion_start_index = stdout_full_text.find(EMOTION_PREFIX, current_pos)
-                justification_start_index = stdout_full_text.find(JUSTIFICATION_PREFIX, current_pos)
-
-                next_prefix_pos = -1
-                is_emotion = False
-
-                if emotion_start_index != -1 and (justification_start_index == -1 or emotion_start_index < justification_start_index):
-                    next_prefix_pos = emotion_start_index
-                    is_emotion = True
-                elif justification_start_index != -1:
-                    next_prefix_pos = justification_start_index
-                    is_emotion = False
-                else:
-                    break # No more known prefixes
-                
-                prefix_len = len(EMOTION_PREFIX) if is_emotion else len(JUSTIFICATION_PREFIX)
-                json_text_start_offset = next_prefix_pos + prefix_len
-                
-                if json_text_start_offset >= len(stdout_full_text):
-                    break
-
-                try:
-                    obj, end_index_offset = decoder.raw_decode(stdout_full_text[json_text_start_offset:])
-                    if is_emotion:
-                        if self.validate_against_schema(obj, emotion_telemetry_schema, "stdout_emotion_telemetry_candidate") is None:
-                            emotion_telemetry_from_stdout = obj
-                            print(f"DEBUG: Successfully parsed EMOTION telemetry from stdout using raw_decode.")
-                    else: # justification
-                        if self.validate_against_schema(obj, justification_log_schema, "stdout_justification_log_candidate") is None:
-                            justification_log_from_stdout = obj
-                            print(f"DEBUG: Successfully parsed JUSTIFICATION log from stdout using raw_decode.")
-                        else:
-                            val_error = self.validate_against_schema(obj, justification_log_schema, "stdout_justification_log_candidate_failed")
-                            print(f"DEBUG: Failed to validate parsed JUSTIFICATION log from stdout: {val_error}")
-                    current_pos = json_text_start_offset + end_index_offset
-                except json.JSONDecodeError as e:
-                    print(f"DEBUG: JSONDecodeError while parsing from stdout (prefix: {'EMOTION' if is_emotion else 'JUSTIFICATION'}): {e}. Skipping to next potential prefix.")
-                    current_pos = next_prefix_pos + prefix_len 
-                    if current_pos >= len(stdout_full_text): break
+            if self._kernel_events is not None:
+                # Structured path: the kernel hands over its validated entries directly
+                stdout_full_text = None
+                with _kernel_lock:
+                    core_output = self.governance_core.execute_loop(loop_input_for_kernel)
+                    kernel_events = self._drain_kernel_events()
+                for event in kernel_events:
+                    if event["kind"] == "emotion_telemetry":
+                        emotion_telemetry_from_kernel = event["data"]
+                    elif event["kind"] == "justification_log":
+                        justification_log_from_kernel = event["data"]
+            else:
+                captured_stdout_io = io.StringIO()
+                with _kernel_lock, contextlib.redirect_stdout(captured_stdout_io):
+                    core_output = self.governance_core.execute_loop(loop_input_for_kernel)
+                stdout_full_text = captured_stdout_io.getvalue()
+                emotion_telemetry_from_kernel, justification_log_from_kernel = self._scan_kernel_stdout(stdout_full_text)
             
             emotion_telemetry_for_response = None
-            if emotion_telemetry_from_stdout is not None:
-                emotion_telemetry_for_response = emotion_telemetry_from_stdout
+            if emotion_telemetry_from_kernel is not None:
+                emotion_telemetry_for_response = emotion_telemetry_from_kernel
                 log_entry = {
                     "request_id": request_id,
                     "timestamp_capture": timestamp_capture,
-                    "telemetry_data": emotion_telemetry_from_stdout
+                    "telemetry_data": emotion_telemetry_from_kernel
                 }
                 self._log_to_file(log_entry, self.emotion_log_file)
             
             justification_log_for_response = None
-            if justification_log_from_stdout is not None:
-                justification_log_for_response = justification_log_from_stdout
+            if justification_log_from_kernel is not None:
+                justification_log_for_response = justification_log_from_kernel
                 log_entry = {
                     "request_id": request_id,
                     "timestamp_capture": timestamp_capture,
-                    "justification_data": justification_log_from_stdout
+                    "justification_data": justification_log_from_kernel
                 }
                 self._log_to_file(log_entry, self.justification_log_file)
+            self.flush_logs()
 
             execution_status = "SUCCESS" 
             error_details = None
             
             if core_output is None and emotion_telemetry_for_response is None and justification_log_for_response is None:
-                 if not stdout_full_text.strip():
-                    print("WARNING: GovernanceCore execute_loop returned None and produced no stdout. This might be unexpected.")
+                 if stdout_full_text is None or not stdout_full_text.strip():
+                    print("WARNING: GovernanceCore execute_loop returned None and produced no output. This might be unexpected.")
 
             response = {
                 "request_id": request_id,
@@ -270,23 +367,22 @@ def verify_logged_hashes(log_file_path: str):
     verified_count = 0
     failed_count = 0
     print(f"--- Verifying hashes in {os.path.basename(log_file_path)} ---")
-    with open(log_file_path, 'r') as f:
+    with open(log_file_path, 'rb') as f:
         for i, line in enumerate(f):
             try:
-                entry_with_hash = json.loads(line.strip())
+                entry_with_hash = orjson.loads(line)
                 stored_hash = entry_with_hash.pop("entry_sha256_hash", None)
                 if stored_hash is None:
                     print(f"  Line {i+1}: No entry_sha256_hash field. Skipping.")
                     failed_count +=1
                     continue
-                original_content_str = _canonical_json_string(entry_with_hash)
-                recalculated_hash = _calculate_sha256_hash(original_content_str)
-                if stored_hash == recalculated_hash:
+                recalculated_hash = _calculate_sha256_hash(_canonical_json_bytes(entry_with_hash))
+                if stored_hash == recalculated_hash or stored_hash == _calculate_sha256_hash(_canonical_json_string(entry_with_hash).encode('utf-8')):
                     verified_count += 1
                 else:
                     print(f"  Line {i+1}: Hash mismatch! Stored: {stored_hash}, Recalculated: {recalculated_hash}")
                     failed_count += 1
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 print(f"  Line {i+1}: Invalid JSON. Skipping.")
                 failed_count += 1
             except Exception as e:
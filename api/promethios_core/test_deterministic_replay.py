@@ -20,6 +20,9 @@ LOG_DIR = os.path.join(REPO_ROOT, "logs")
 NUM_REPLAYS = 3
 RUNTIME_EXECUTOR_ENDPOINT = "http://localhost:8002/loop/execute"  # Updated to port 8002
 
+# Shared session so replays reuse one keep-alive connection to the runtime executor
+SESSION = requests.Session()
+
 # Ensure PROMETHIOS_KERNEL_PATH is set in the environment where runtime_executor.py is started.
 # This script does not directly control the kernel path for a separate server process.
 
@@ -44,7 +47,7 @@ def run_single_execution(input_payload, execution_num):
     """Runs a single execution by making an HTTP POST request to the runtime_executor."""
     print(f"--- Starting Execution {execution_num} for Replay Test (Request ID: {input_payload['request_id']}) ---")
     try:
-        response = requests.post(RUNTIME_EXECUTOR_ENDPOINT, json=input_payload, timeout=60)
+        response = SESSION.post(RUNTIME_EXECUTOR_ENDPOINT, json=input_payload, timeout=60)
         response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
         
         print(f"Execution {execution_num} Status Code: {response.status_code}")
@@ -3,9 +3,11 @@
 """validate_schema.py: Validate log entries against their schemas."""
 
 import json
-import jsonschema
+import orjson
+import fastjsonschema
 import os
 import sys
+from functools import lru_cache
 
 # Get the absolute path of the repository root directory
 REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -22,6 +24,22 @@ JUSTIFICATION_LOG_SCHEMA = os.path.join(SCHEMA_DIR, "loop_justification_log.sche
 EMOTION_TELEMETRY_LOG = os.path.join(LOG_DIR, "emotion_telemetry.log.jsonl")
 JUSTIFICATION_LOG = os.path.join(LOG_DIR, "justification.log.jsonl")
 
+@lru_cache(maxsize=64)
+def _get_validator(schema_json):
+    """Compile a validator for a schema given as canonical JSON text."""
+    return fastjsonschema.compile(json.loads(schema_json))
+
+def compiled_for(schema):
+    """Return the compiled validator for a schema, reusing it for equivalent schemas.
+    
+    Args:
+        schema: JSON schema dictionary
+        
+    Returns:
+        Validator callable raising fastjsonschema.JsonSchemaValueException on invalid data
+    """
+    return _get_validator(json.dumps(schema, sort_keys=True))
+
 def validate_log_file(log_file_path, schema_file_path, log_type):
     """Validate all entries in a log file against its schema.
     
@@ -36,23 +54,27 @@ def validate_log_file(log_file_path, schema_file_path, log_type):
     print(f"Validating {log_type} log entries against schema...")
     
     try:
-        # Load schema
+        # Load schema and fetch its compiled validator, reused across calls
         with open(schema_file_path, 'r') as f:
             schema = json.load(f)
+        validate = compiled_for(schema)
         
         # Load log entries
-        with open(log_file_path, 'r') as f:
-            entries = [json.loads(line) for line in f]
+        with open(log_file_path, 'rb') as f:
+            entries = [orjson.loads(line) for line in f]
         
-        # Validate each entry
-        all_valid = True
+        # Validate each entry, formatting messages only for failures
+        failures = []
         for i, entry in enumerate(entries):
             try:
-                jsonschema.validate(instance=entry, schema=schema)
-                print(f"  Entry {i+1}: PASSED")
-            except jsonschema.exceptions.ValidationError as e:
-                print(f"  Entry {i+1}: FAILED - {e}")
-                all_valid = False
+                validate(entry)
+            except fastjsonschema.JsonSchemaValueException as e:
+                failures.append((i, e))
+        
+        for i, e in failures:
+            print(f"  Entry {i+1}: FAILED - {e}")
+        all_valid = not failures
+        print(f"  {len(entries) - len(failures)} of {len(entries)} entries passed")
         
         if all_valid:
             print(f"All {log_type} log entries passed schema validation")
@@ -3,15 +3,31 @@
 """verify_log_hashes.py: Utility to verify SHA256 hashes in Promethios log files."""
 
 import json
+import orjson
 import hashlib
 import argparse
 import os
 import sys
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 
 # Get the absolute path of the repository root directory
 REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
 LOG_DIR = os.path.join(REPO_ROOT, "logs")
+VERIFY_CACHE_PATH = os.path.join(LOG_DIR, ".verify_cache.json")
+
+def _canonical_json_bytes(entry_dict):
+    """Serialize an entry in GovernanceCore's canonical form (orjson, sorted keys).
+    
+    orjson is required: the stdlib encoder formats some floats differently (1e-07 vs 1e-7),
+    which would report false hash mismatches.
+    """
+    return orjson.dumps(entry_dict, option=orjson.OPT_SORT_KEYS)
+
+_loads = orjson.loads
+
+# Bound once: hashlib.sha256 is OpenSSL's constructor (SHA-NI where available)
+_sha256 = hashlib.sha256
 
 def calculate_entry_hash(entry_dict):
     """Calculate SHA256 hash for a log entry.
@@ -22,18 +38,24 @@ def calculate_entry_hash(entry_dict):
     Returns:
         String containing the hex digest of the SHA256 hash
     """
-    # Create a copy of the entry to avoid modifying the original
-    entry_copy = entry_dict.copy()
-    
-    # Remove the hash field if it exists
-    if 'entry_sha256_hash' in entry_copy:
-        del entry_copy['entry_sha256_hash']
+    # Only copy when the hash field is present, leaving the caller's entry unmodified
+    if 'entry_sha256_hash' in entry_dict:
+        entry_dict = {key: value for key, value in entry_dict.items() if key != 'entry_sha256_hash'}
         
-    # Sort keys for deterministic serialization
-    entry_json = json.dumps(entry_copy, sort_keys=True)
+    # Sort keys for deterministic serialization; must match GovernanceCore's canonical form
+    entry_json = _canonical_json_bytes(entry_dict)
     
     # Calculate hash
-    return hashlib.sha256(entry_json.encode('utf-8')).hexdigest()
+    return _sha256(entry_json).hexdigest()
+
+def calculate_legacy_entry_hash(entry_dict):
+    """Calculate SHA256 hash using the pre-orjson canonical form (json.dumps with sort_keys).
+    
+    Entries logged before GovernanceCore switched to orjson were hashed over this form.
+    """
+    entry_copy = {key: value for key, value in entry_dict.items() if key != 'entry_sha256_hash'}
+    entry_json = json.dumps(entry_copy, sort_keys=True)
+    return _sha256(entry_json.encode('utf-8')).hexdigest()
 
 def verify_log_file(log_file):
     """Verify the integrity of a log file by checking embedded hashes.
@@ -46,58 +68,116 @@ def verify_log_file(log_file):
         - success: Boolean indicating if all entries passed verification
         - manifest_entries: List of (line_number, hash) tuples for the manifest
     """
-    print(f"Verifying {os.path.basename(log_file)}...", end=" ")
+    success, manifest_entries, _ = verify_log_file_from(log_file)
+    return success, manifest_entries
+
+def verify_log_file_from(log_file, start_offset=0, start_line=1, previous_hash=None):
+    """Verify a log file starting at a byte offset, continuing the hash chain from previous_hash.
+    
+    Args:
+        log_file: Path to the log file
+        start_offset: Byte offset of the first line to verify (0 for the whole file)
+        start_line: Line number of the line at start_offset
+        previous_hash: Hash of the entry preceding start_offset, or None at the start of the file
+        
+    Returns:
+        Tuple of (success, manifest_entries, end_offset)
+        - end_offset: Byte offset just past the last line read
+    """
+    if start_offset:
+        print(f"Verifying {os.path.basename(log_file)} from line {start_line}...", end=" ")
+    else:
+        print(f"Verifying {os.path.basename(log_file)}...", end=" ")
     
     success = True
     manifest_entries = []
-    previous_hash = None
     
-    with open(log_file, 'r') as f:
-        for line_num, line in enumerate(f, 1):
+    # Bind the per-line callables locally to skip global and attribute lookups in the loop
+    loads = _loads
+    calc_hash = calculate_entry_hash
+    append_manifest_entry = manifest_entries.append
+    
+    # Stream the file in large binary chunks; each line's bytes are parsed directly
+    with open(log_file, 'rb', buffering=1 << 20) as f:
+        f.seek(start_offset)
+        for line_num, line in enumerate(f, start_line):
             try:
-                entry = json.loads(line.strip())
+                entry = loads(line)
                 
-                # Check if entry has a hash
-                if 'entry_sha256_hash' not in entry:
+                # Take the stored hash out of the freshly parsed entry, leaving exactly the hashed content
+                stored_hash = entry.pop('entry_sha256_hash', None)
+                if stored_hash is None:
                     print(f"FAILED\nEntry at line {line_num} is missing entry_sha256_hash")
                     success = False
                     continue
                 
-                # Get the stored hash
-                stored_hash = entry['entry_sha256_hash']
-                
                 # Calculate the expected hash
-                expected_hash = calculate_entry_hash(entry)
+                expected_hash = calc_hash(entry)
                 
-                # Compare hashes
-                if stored_hash != expected_hash:
+                # Compare hashes (accepting entries written with the legacy canonical form)
+                if stored_hash != expected_hash and stored_hash != calculate_legacy_entry_hash(entry):
                     print(f"FAILED\nHash mismatch at line {line_num}")
                     print(f"  Stored:   {stored_hash}")
                     print(f"  Expected: {expected_hash}")
                     success = False
                 
                 # Optional: Check chain integrity if previous_entry_hash is present
-                if previous_hash is not None and 'previous_entry_hash' in entry:
-                    if entry['previous_entry_hash'] != previous_hash:
-                        print(f"FAILED\nChain integrity broken at line {line_num}")
-                        print(f"  Stored previous hash:   {entry['previous_entry_hash']}")
-                        print(f"  Expected previous hash: {previous_hash}")
-                        success = False
+                # (a missing previous_entry_hash defaults to previous_hash, i.e. is not checked)
+                linked_hash = entry.get('previous_entry_hash', previous_hash)
+                if previous_hash is not None and linked_hash != previous_hash:
+                    print(f"FAILED\nChain integrity broken at line {line_num}")
+                    print(f"  Stored previous hash:   {linked_hash}")
+                    print(f"  Expected previous hash: {previous_hash}")
+                    success = False
                 
                 # Update previous hash for next iteration
                 previous_hash = stored_hash
                 
                 # Add to manifest
-                manifest_entries.append((line_num, stored_hash))
+                append_manifest_entry((line_num, stored_hash))
                 
-            except json.JSONDecodeError:
+            except json.JSONDecodeError: # orjson's JSONDecodeError subclasses this
                 print(f"FAILED\nInvalid JSON at line {line_num}")
                 success = False
+        
+        end_offset = f.tell()
     
     if success:
         print("PASSED")
     
-    return success, manifest_entries
+    return success, manifest_entries, end_offset
+
+def load_verify_cache():
+    """Load the record of previously verified log files, or an empty cache if unavailable."""
+    try:
+        with open(VERIFY_CACHE_PATH, 'rb') as f:
+            cache = _loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_verify_cache(cache):
+    """Persist the verify cache next to the logs."""
+    with open(VERIFY_CACHE_PATH, 'w') as f:
+        json.dump(cache, f, indent=2)
+
+def _file_signature(stat_result):
+    return {"size": stat_result.st_size, "mtime_ns": stat_result.st_mtime_ns}
+
+def _hash_file_bytes(log_file, start, end, hasher=None):
+    """Feed the raw bytes log_file[start:end] into hasher (a new SHA-256 if None) and return it."""
+    if hasher is None:
+        hasher = _sha256()
+    with open(log_file, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = f.read(min(remaining, 1 << 20))
+            if not chunk:
+                break
+            hasher.update(chunk)
+            remaining -= len(chunk)
+    return hasher
 
 def generate_manifest(manifest_entries, log_files):
     """Generate a manifest file containing all verified hashes.
@@ -108,18 +188,16 @@ def generate_manifest(manifest_entries, log_files):
     """
     manifest_path = os.path.join(LOG_DIR, "sha256_manifest.txt")
     
+    # Build the whole manifest up front and hand it to the file in one writelines call
+    parts = ["# SHA256 Manifest\n", f"# Generated: {datetime.datetime.now().isoformat()}\n\n"]
+    
+    for log_file in log_files:
+        parts.append(f"## {os.path.basename(log_file)}\n")
+        parts.extend([f"{line_num}: {hash_value}\n" for line_num, hash_value in manifest_entries[log_file]])
+        parts.append("\n")
+    
     with open(manifest_path, 'w') as f:
-        f.write("# SHA256 Manifest\n")
-        f.write(f"# Generated: {datetime.datetime.now().isoformat()}\n\n")
-        
-        for log_file in log_files:
-            basename = os.path.basename(log_file)
-            f.write(f"## {basename}\n")
-            
-            for line_num, hash_value in manifest_entries[log_file]:
-                f.write(f"{line_num}: {hash_value}\n")
-            
-            f.write("\n")
+        f.writelines(parts)
     
     print(f"SHA256 manifest generated: {manifest_path}")
 
@@ -127,6 +205,11 @@ def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Verify SHA256 hashes in Promethios log files and generate manifest.")
     parser.add_argument("--generate", action="store_true", help="Generate SHA256 manifest for all log files")
+    parser.add_argument("--parallel", action="store_true", help="Verify the log files concurrently, one process per file")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Skip logs whose size and mtime are unchanged since the last successful verification; for logs that "
+                             "only grew, check the earlier bytes against their recorded SHA-256 and verify just the appended "
+                             "lines (ignored with --generate)")
     
     args = parser.parse_args()
     
@@ -145,18 +228,70 @@ def main():
     all_success = True
     manifest_entries = {}
     
+    existing_log_files = []
     for log_file in log_files:
         if not os.path.exists(log_file):
             print(f"Warning: Log file {log_file} does not exist, skipping")
             continue
-        
-        success, entries = verify_log_file(log_file)
+        existing_log_files.append(log_file)
+    
+    # Work avoidance: a log unchanged since it last verified cleanly is not re-hashed, and a log
+    # that has only grown is verified from the last-known-good offset, continuing its hash chain,
+    # once a raw SHA-256 of the bytes before that offset confirms they were not rewritten.
+    # A full pass is always made when generating the manifest, which needs every hash.
+    use_cache = args.incremental and not args.generate
+    verify_cache = load_verify_cache() if use_cache else {}
+    signatures = {log_file: _file_signature(os.stat(log_file)) for log_file in existing_log_files}
+    
+    # (log_file, start_offset, start_line, previous_hash) for each log still to verify
+    pending = []
+    # Running SHA-256 of each resumed log's already-verified bytes, extended after verification
+    prefix_hashers = {}
+    for log_file in existing_log_files:
+        signature = signatures[log_file]
+        cached = verify_cache.get(os.path.basename(log_file)) if use_cache else None
+        if cached is not None and cached.get("size") == signature["size"] and cached.get("mtime_ns") == signature["mtime_ns"]:
+            print(f"Verifying {os.path.basename(log_file)}... PASSED (unchanged since last verification)")
+            continue
+        if cached is not None and "prefix_sha256" in cached and cached.get("offset", 0) <= signature["size"] and cached.get("mtime_ns", 0) <= signature["mtime_ns"]:
+            prefix_hasher = _hash_file_bytes(log_file, 0, cached["offset"])
+            if prefix_hasher.hexdigest() == cached["prefix_sha256"]:
+                prefix_hashers[log_file] = prefix_hasher
+                pending.append((log_file, cached["offset"], cached.get("lines", 0) + 1, cached.get("last_hash")))
+                continue
+            print(f"Note: {os.path.basename(log_file)} changed before its last verified line, verifying from the start")
+        # No usable record, the file shrank, went back in time or was rewritten: verify from the start
+        pending.append((log_file, 0, 1, None))
+    
+    if args.parallel and len(pending) > 1:
+        # The files are independent, so each is verified in its own process (progress output may interleave)
+        with ProcessPoolExecutor(max_workers=len(pending)) as executor:
+            results = list(executor.map(verify_log_file_from, *zip(*pending)))
+    else:
+        results = [verify_log_file_from(*task) for task in pending]
+    
+    for (log_file, start_offset, start_line, previous_hash), (success, entries, end_offset) in zip(pending, results):
         manifest_entries[log_file] = entries
         all_success = all_success and success
+        if use_cache:
+            if success:
+                prefix_hasher = _hash_file_bytes(log_file, start_offset, end_offset, prefix_hashers.get(log_file))
+                verify_cache[os.path.basename(log_file)] = dict(
+                    signatures[log_file],
+                    offset=end_offset,
+                    lines=start_line - 1 + len(entries),
+                    last_hash=entries[-1][1] if entries else previous_hash,
+                    prefix_sha256=prefix_hasher.hexdigest()
+                )
+            else:
+                verify_cache.pop(os.path.basename(log_file), None)
+    
+    if use_cache:
+        save_verify_cache(verify_cache)
     
     # Generate manifest if requested and all verifications passed
     if args.generate and all_success:
-        generate_manifest(manifest_entries, [f for f in log_files if os.path.exists(f)])
+        generate_manifest(manifest_entries, existing_log_files)
         print("All logs passed integrity verification")
     elif args.generate and not all_success:
         print("Some logs failed integrity verification, manifest not generated")
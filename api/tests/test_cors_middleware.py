@@ -0,0 +1,66 @@
+"""
+Unit tests for the CORS Middleware module.
+
+This module contains tests for the pure-ASGI wildcard CORS middleware.
+"""
+
+import unittest
+import sys
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add the parent directory to the path so we can import the modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Import the module to test
+from compliance_api.cors_middleware import FastWildcardCORS
+
+class TestFastWildcardCORS(unittest.TestCase):
+    """Tests for the FastWildcardCORS middleware."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        app = FastAPI()
+
+        @app.get("/")
+        async def root():
+            return {"message": "ok"}
+
+        app.add_middleware(FastWildcardCORS)
+        self.client = TestClient(app)
+
+    def test_cross_origin_request(self):
+        """Test that cross-origin responses echo the origin with credentials."""
+        response = self.client.get("/", headers={"Origin": "http://example.com"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"message": "ok"})
+        self.assertEqual(response.headers["access-control-allow-origin"], "http://example.com")
+        self.assertEqual(response.headers["access-control-allow-credentials"], "true")
+        self.assertEqual(response.headers["vary"], "Origin")
+
+    def test_same_origin_request(self):
+        """Test that requests without an Origin header are passed through untouched."""
+        response = self.client.get("/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("access-control-allow-origin", response.headers)
+
+    def test_preflight_request(self):
+        """Test that preflight requests are answered without reaching the app."""
+        response = self.client.options("/", headers={
+            "Origin": "http://example.com",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type"
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "OK")
+        self.assertEqual(response.headers["access-control-allow-origin"], "http://example.com")
+        self.assertEqual(response.headers["access-control-allow-headers"], "content-type")
+        self.assertIn("POST", response.headers["access-control-allow-methods"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,7 @@ This module contains tests for the Lending Club API connector and data transform
 import unittest
 import sys
 import os
-import json
+import orjson
 from unittest.mock import MagicMock, patch
 
 # Add the parent directory to the path so we can import the modules
@@ -27,13 +27,13 @@ class TestLendingClubAPI(unittest.TestCase):
         # Create the API client
         self.api = LendingClubAPI()
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_available_loans(self, mock_get):
         """Test fetching available loans from the API."""
         # Mock the API response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "loans": [
                 {
                     "id": "123456",
@@ -80,7 +80,7 @@ class TestLendingClubAPI(unittest.TestCase):
                     "totalAcc": 8
                 }
             ]
-        }
+        })
         mock_get.return_value = mock_response
         
         # Test the get_available_loans method
@@ -107,13 +107,13 @@ class TestLendingClubAPI(unittest.TestCase):
         self.assertEqual(call_args["headers"]["Authorization"], "Bearer test_api_key")
         self.assertEqual(call_args["params"]["limit"], 2)
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_loan_details(self, mock_get):
         """Test fetching details for a specific loan."""
         # Mock the API response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "id": "123456",
             "loanAmount": 10000,
             "purpose": "debt_consolidation",
@@ -134,7 +134,7 @@ class TestLendingClubAPI(unittest.TestCase):
             "revolBal": 10000,
             "revolUtil": 30.0,
             "totalAcc": 10
-        }
+        })
         mock_get.return_value = mock_response
         
         # Test the get_loan_details method
@@ -151,7 +151,7 @@ class TestLendingClubAPI(unittest.TestCase):
         call_args = mock_get.call_args[1]
         self.assertEqual(call_args["headers"]["Authorization"], "Bearer test_api_key")
     
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_api_error_handling(self, mock_get):
         """Test handling of API errors."""
         # Mock an API error
@@ -7,7 +7,7 @@ This module contains tests for the OpenAI-powered conversational explainability
 import unittest
 import sys
 import os
-import json
+import orjson
 from unittest.mock import MagicMock, patch
 
 # Add the parent directory to the path so we can import the modules
@@ -83,7 +83,7 @@ class TestOpenAIExplainer(unittest.TestCase):
             ]
         }
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_explain_decision(self, mock_post):
         """Test generating an explanation for a decision."""
         # Mock the OpenAI API response
@@ -114,7 +114,7 @@ class TestOpenAIExplainer(unittest.TestCase):
         self.assertEqual(call_args["json"]["model"], "gpt-4")
         self.assertGreaterEqual(len(call_args["json"]["messages"]), 2)
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_explain_decision_with_query(self, mock_post):
         """Test generating an explanation for a decision with a specific query."""
         # Mock the OpenAI API response
@@ -150,7 +150,7 @@ class TestOpenAIExplainer(unittest.TestCase):
         user_message = call_args["json"]["messages"][1]["content"]
         self.assertIn(query, user_message)
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_generate_recommendations(self, mock_post):
         """Test generating recommendations based on application data and trust factors."""
         # Mock the OpenAI API response
@@ -160,7 +160,7 @@ class TestOpenAIExplainer(unittest.TestCase):
             "choices": [
                 {
                     "message": {
-                        "content": json.dumps([
+                        "content": orjson.dumps([
                             {
                                 "title": "Improve Data Quality",
                                 "description": "Verify employment information and resolve inconsistencies in income data to improve the data quality score.",
@@ -176,7 +176,7 @@ class TestOpenAIExplainer(unittest.TestCase):
                                 "description": "Consider retraining the model with additional validated data to improve prediction confidence.",
                                 "priority": "medium"
                             }
-                        ])
+                        ]).decode()
                     }
                 }
             ]
@@ -209,7 +209,29 @@ class TestOpenAIExplainer(unittest.TestCase):
         self.assertEqual(call_args["json"]["model"], "gpt-4")
         self.assertEqual(call_args["json"]["response_format"]["type"], "json_object")
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
+    def test_generate_recommendations_invalid_json(self, mock_post):
+        """Test that unparseable recommendation content is reported as an error recommendation."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "choices": [
+                {
+                    "message": {
+                        "content": "not valid json"
+                    }
+                }
+            ]
+        }
+        mock_post.return_value = mock_response
+
+        recommendations = self.explainer.generate_recommendations({"application_id": "TEST123"}, {})
+
+        self.assertEqual(len(recommendations), 1)
+        self.assertEqual(recommendations[0]["title"], "Error generating recommendations")
+        self.assertEqual(recommendations[0]["priority"], "high")
+
+    @patch('requests.Session.post')
     def test_api_error_handling(self, mock_post):
         """Test handling of API errors."""
         # Mock an API error
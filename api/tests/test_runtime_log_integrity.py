@@ -0,0 +1,85 @@
+"""
+Integration tests for the runtime executor's log output.
+
+This module runs the runtime executor against the real GovernanceCore and checks
+that the kernel's hash-chained logs still pass the integrity and schema checks.
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+
+# Path to the promethios_core directory holding the kernel, runtime and log utilities
+PROMETHIOS_CORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "promethios_core")
+
+# Runs two loops through the runtime executor, the way /loop/execute does
+RUN_TWO_LOOPS = """
+import sys
+from runtime_executor import RuntimeExecutor
+
+executor = RuntimeExecutor()
+for task in ("first task", "second task"):
+    response = executor.execute_core_loop({"plan_input": {"task_description": task}, "operator_override_signal": None})
+    if response["execution_status"] != "SUCCESS":
+        sys.exit(f"loop failed: {response['error_details']}")
+"""
+
+# Breaks the kernel's justification log file descriptor, then keeps logging
+LOG_AFTER_WRITE_FAILURE = """
+import os, sys
+import governance_core
+
+kernel = governance_core.GovernanceCore()
+os.close(kernel._justification_log_writer._fd)
+kernel.execute_loop({"plan_details": {"task_description": "first task"}})
+chain_head = kernel.last_justification_hash
+try:
+    kernel.execute_loop({"plan_details": {"task_description": "second task"}})
+except governance_core.LogWriteError:
+    sys.exit(0 if kernel.last_justification_hash == chain_head else "chain advanced past the failed write")
+sys.exit("write failure was not reported")
+"""
+
+class TestRuntimeLogIntegrity(unittest.TestCase):
+    """Tests for the logs written while the runtime executor drives the real kernel."""
+
+    def setUp(self):
+        """Copy promethios_core to a scratch directory so the run starts from empty logs."""
+        self.work_dir = tempfile.mkdtemp()
+        self.core_dir = os.path.join(self.work_dir, "promethios_core")
+        shutil.copytree(PROMETHIOS_CORE_DIR, self.core_dir, ignore=shutil.ignore_patterns("logs", "__pycache__"))
+        self.env = dict(os.environ, PROMETHIOS_KERNEL_PATH=self.core_dir)
+
+    def tearDown(self):
+        """Remove the scratch directory."""
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def _run(self, *args):
+        return subprocess.run([sys.executable, *args], cwd=self.core_dir, env=self.env,
+                              capture_output=True, text=True, timeout=120)
+
+    def test_kernel_logs_verify_after_two_loops(self):
+        """Test that two runtime loops leave the kernel logs hash-chain and schema valid."""
+        result = self._run("-c", RUN_TWO_LOOPS)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+        # The runtime's own entries must not be mixed into the kernel's chained logs
+        log_files = sorted(os.listdir(os.path.join(self.core_dir, "logs")))
+        self.assertIn("runtime_justification.log.jsonl", log_files)
+
+        result = self._run("verify_log_hashes.py")
+        self.assertEqual(result.returncode, 0, result.stdout)
+
+        result = self._run("validate_schema.py")
+        self.assertEqual(result.returncode, 0, result.stdout)
+
+    def test_kernel_reports_failed_log_writes(self):
+        """Test that a failed log write is raised on the next entry instead of leaving a silent gap."""
+        result = self._run("-c", LOG_AFTER_WRITE_FAILURE)
+        self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+if __name__ == "__main__":
+    unittest.main()